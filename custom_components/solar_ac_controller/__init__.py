@@ -22,6 +22,7 @@ from .const import (
     SolarACData,
 )
 from .coordinator import SolarACCoordinator
+from .helpers import _normalize_learned_entry
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,22 +51,11 @@ async def _async_migrate_data(
     learned_power = old_data.get("learned_power", {})
     if not isinstance(learned_power, dict):
         learned_power = {}
-    for zone, val in learned_power.items():
-        if val is None:
-            learned_power[zone] = {
-                "default": initial_lp,
-                "heat": initial_lp,
-                "cool": initial_lp,
-            }
-        elif isinstance(val, (int, float)):
-            v = float(val)
-            learned_power[zone] = {"default": v, "heat": v, "cool": v}
-        elif isinstance(val, dict):
-            for mode in ["default", "heat", "cool"]:
-                if mode not in val:
-                    val[mode] = initial_lp
-
-    migrated_data["learned_power"] = learned_power
+
+    migrated_data["learned_power"] = {
+        zone: _normalize_learned_entry(val, initial_lp)
+        for zone, val in learned_power.items()
+    }
     migrated_data["samples"] = old_data.get("samples", 0)
 
     return migrated_data
@@ -151,21 +141,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     # 2. Storage Setup (manual migration because Store no longer accepts migrate_fn)
+    # No custom encoder: Store then serializes with Home Assistant's orjson
+    # fast path. Payloads are kept to str keys and int/float/str values.
     store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
 
     try:
-        stored_data = await store.async_load()
+        loaded = await store.async_load()
     except Exception:  # pragma: no cover - defensive
         _LOGGER.exception("Failed to load stored data; falling back to defaults")
-        stored_data = None
-
-    if stored_data is None:
-        stored_data = {"learned_power": {}, "samples": 0}
+        loaded = None
 
-    # 1. Migrate
-    migrated = await _async_migrate_data(0, 0, stored_data, initial_lp)
-    if migrated != stored_data:
-        stored_data = migrated
+    # 1. Migrate (returns a new dict; the loaded payload is left untouched)
+    migrated = await _async_migrate_data(0, 0, loaded, initial_lp)
 
     # 2. Rounding cleanup
     def _round_map(val):
@@ -173,28 +160,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             return {k: _round_map(v) for k, v in val.items()}
         return int(round(float(val)))
 
-    stored_data["learned_power"] = _round_map(stored_data.get("learned_power", {}))
-
-    # 3. Integration enabled state (persisted)
-    # Use stored_data directly (store.data does not exist)
-    stored_data["integration_enabled"] = stored_data.get("integration_enabled", True)
-    # 3b. Activity logging enabled state (persisted)
-    stored_data["activity_logging_enabled"] = stored_data.get(
-        "activity_logging_enabled", False
-    )
-    # 3c. Season mode state (persisted)
-    stored_data["season_mode"] = stored_data.get(
-        "season_mode",
-        entry.options.get(
-            CONF_SEASON_MODE, entry.data.get(CONF_SEASON_MODE, DEFAULT_SEASON_MODE)
+    stored_data = {
+        **migrated,
+        "learned_power": _round_map(migrated.get("learned_power", {})),
+        # 3. Persisted integration enabled, activity logging and season states
+        "integration_enabled": migrated.get("integration_enabled", True),
+        "activity_logging_enabled": migrated.get("activity_logging_enabled", False),
+        "season_mode": migrated.get(
+            "season_mode",
+            entry.options.get(
+                CONF_SEASON_MODE, entry.data.get(CONF_SEASON_MODE, DEFAULT_SEASON_MODE)
+            ),
         ),
-    )
+    }
 
-    # 4. Save ONCE
-    try:
-        await store.async_save(stored_data)
-    except Exception:
-        _LOGGER.debug("Skipped save during storage load")
+    # 4. Save only when migration or defaults changed what is on disk
+    if stored_data != loaded:
+        try:
+            await store.async_save(stored_data)
+        except Exception:
+            _LOGGER.debug("Skipped save during storage load")
 
     # 3. Create Device (The "Master" record)
     device_registry = dr.async_get(hass)
@@ -226,7 +211,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await coordinator.async_config_entry_first_refresh()
     await hass.config_entries.async_forward_entry_setups(entry, ALL_PLATFORMS)
 
-    entry.add_update_listener(async_reload_entry)
+    # Options changes reload the entry, which re-resolves every value the
+    # coordinator caches at startup (entity ids, thresholds, zone maps)
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     # Service registration moved to async_setup for best practices
 
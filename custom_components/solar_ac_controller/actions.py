@@ -4,11 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from typing import TYPE_CHECKING
 
-
-from homeassistant.util import dt as dt_util
-from .zones import ZoneManager
+import voluptuous as vol
+from homeassistant.exceptions import HomeAssistantError
 
 if TYPE_CHECKING:
     from .coordinator import SolarACCoordinator
@@ -34,7 +34,7 @@ class ActionExecutor:
         if self.coordinator.last_action == f"add_{next_zone}":
             return
 
-        await self.coordinator._log(
+        self.coordinator._log(
             f"[ZONE_ADD_ATTEMPT] zone={next_zone} "
             f"add_conf={round(self.coordinator.last_add_conf)} export={round(export)} "
             f"req_export={round(required_export)} samples={self.coordinator.samples} "
@@ -55,13 +55,11 @@ class ActionExecutor:
         if self.coordinator.last_action == f"remove_{last_zone}":
             return
 
-        zone_mgr = ZoneManager(self.coordinator)
-
-        await self.coordinator._log(
+        self.coordinator._log(
             f"[ZONE_REMOVE_ATTEMPT] zone={last_zone} "
             f"remove_conf={round(self.coordinator.last_remove_conf)} "
             f"import={round(import_power)} "
-            f"short_cycling={zone_mgr.is_short_cycling(last_zone)} "
+            f"short_cycling={self.coordinator.zone_manager.is_short_cycling(last_zone)} "
             f"conf={round(self.coordinator.confidence)} "
             f"thr_add={self.coordinator.add_confidence_threshold} "
             f"thr_rem={self.coordinator.remove_confidence_threshold}"
@@ -72,7 +70,7 @@ class ActionExecutor:
     async def add_zone(self, zone: str, ac_power_before: float) -> None:
         """Start learning and turn on zone."""
         if self.coordinator.learning_active:
-            await self.coordinator._log(
+            self.coordinator._log(
                 f"[LEARNING_SKIPPED_ALREADY_ACTIVE] zone={zone} "
                 f"current_zone={self.coordinator.learning_zone}"
             )
@@ -81,132 +79,84 @@ class ActionExecutor:
         # Mark learning before action, but actual power delta is validated later
         await self.coordinator.controller.start_learning(zone, ac_power_before)
 
-        start = dt_util.utcnow().timestamp()
+        start = time.monotonic()
         try:
             await self.call_entity_service(zone, True)
         finally:
-            now_ts = dt_util.utcnow().timestamp()
+            now = time.monotonic()
             self.coordinator.last_action_start_ts = start
-            self.coordinator.last_action_duration = now_ts - start
-            self.coordinator.zone_last_changed[zone] = now_ts
+            self.coordinator.last_action_duration = now - start
+            self.coordinator.zone_last_changed[zone] = now
             self.coordinator.zone_last_changed_type[zone] = "on"
 
-        await asyncio.sleep(self.coordinator.action_delay_seconds)
+        self._start_settle_delay()
 
-        await self.coordinator._log(
+        self.coordinator._log(
             f"[LEARNING_START] zone={zone} ac_before={round(ac_power_before)} "
             f"samples={self.coordinator.samples}"
         )
 
     async def remove_zone(self, zone: str) -> None:
         """Turn off zone and update short-cycle memory."""
-        start = dt_util.utcnow().timestamp()
+        start = time.monotonic()
         try:
             await self.call_entity_service(zone, False)
         finally:
-            now_ts = dt_util.utcnow().timestamp()
+            now = time.monotonic()
             self.coordinator.last_action_start_ts = start
-            self.coordinator.last_action_duration = now_ts - start
-            self.coordinator.zone_last_changed[zone] = now_ts
+            self.coordinator.last_action_duration = now - start
+            self.coordinator.zone_last_changed[zone] = now
             self.coordinator.zone_last_changed_type[zone] = "off"
 
-        await asyncio.sleep(self.coordinator.action_delay_seconds)
+        self._start_settle_delay()
 
-        await self.coordinator._log(
+        self.coordinator._log(
             f"[ZONE_REMOVE_SUCCESS] zone={zone} import_after={round(self.coordinator.ema_5m)}"
         )
 
-    async def call_entity_service(self, entity_id: str, turn_on: bool) -> None:
-        """Call turn_on/turn_off service for the entity's domain, with climate fallback. If climate, set hvac_mode if needed."""
-        domain = entity_id.split(".")[0]
-        service = "turn_on" if turn_on else "turn_off"
+    def _start_settle_delay(self) -> None:
+        """Hold further add/remove decisions until the action has settled.
 
-        # If turning ON a climate entity, first turn on, then check/set hvac_mode
-        if turn_on and domain == "climate":
-            try:
-                await self.coordinator.hass.services.async_call(
-                    domain,
-                    service,
-                    {"entity_id": entity_id},
-                    blocking=True,
-                )
-            except Exception as e:
-                _LOGGER.debug(
-                    "Primary service %s.%s failed for %s: %s",
-                    domain,
-                    service,
-                    entity_id,
-                    e,
-                )
-                try:
-                    await self.coordinator.hass.services.async_call(
-                        "climate",
-                        service,
-                        {"entity_id": entity_id},
-                        blocking=True,
-                    )
-                    _LOGGER.warning(
-                        "Primary service %s.%s failed for %s — used climate.%s as fallback",
-                        domain,
-                        service,
-                        entity_id,
-                        service,
-                    )
-                except Exception as e:
-                    _LOGGER.exception(
-                        "Fallback climate.%s failed for %s: %s", service, entity_id, e
-                    )
-                    return
-            # After turning on, check and set hvac_mode if needed
-            # Wait briefly for state to update
-            await asyncio.sleep(0.2)
-            state = self.coordinator.hass.states.get(entity_id)
-            desired_mode = getattr(self.coordinator, "season_mode", "cool")
-            if state:
-                current_mode = state.attributes.get("hvac_mode")
-                if current_mode != desired_mode:
-                    await self.coordinator.hass.services.async_call(
-                        "climate",
-                        "set_hvac_mode",
-                        {"entity_id": entity_id, "hvac_mode": desired_mode},
-                        blocking=True,
-                    )
-            return
+        The update cycle checks the deadline instead of sleeping through it.
+        """
+        self.coordinator._settle_until = (
+            time.monotonic() + self.coordinator.action_delay_seconds
+        )
 
-        # Non-climate or turn_off: original logic
-        try:
-            await self.coordinator.hass.services.async_call(
-                domain,
-                service,
-                {"entity_id": entity_id},
-                blocking=True,
-            )
+    async def call_entity_service(self, entity_id: str, turn_on: bool) -> None:
+        """Call turn_on/turn_off for the entity's domain, with climate fallback.
+
+        Climate entities being turned on get their hvac_mode aligned with the
+        season afterwards; everything else goes through the coordinator, which
+        remembers entities that need the climate fallback.
+        """
+        domain = self.coordinator._entity_domain(entity_id)
+        if not (turn_on and domain == "climate"):
+            await self.coordinator._call_entity_service(entity_id, turn_on)
             return
-        except Exception as e:
-            _LOGGER.debug(
-                "Primary service %s.%s failed for %s: %s",
-                domain,
-                service,
-                entity_id,
-                e,
-            )
 
+        # Turning ON a climate entity: turn on first, then check/set hvac_mode
         try:
             await self.coordinator.hass.services.async_call(
                 "climate",
-                service,
+                "turn_on",
                 {"entity_id": entity_id},
                 blocking=True,
             )
-            _LOGGER.warning(
-                "Primary service %s.%s failed for %s — used climate.%s as fallback",
-                domain,
-                service,
-                entity_id,
-                service,
-            )
+        except (HomeAssistantError, vol.Invalid) as e:
+            _LOGGER.error("climate.turn_on failed for %s: %s", entity_id, e)
             return
-        except Exception as e:
-            _LOGGER.exception(
-                "Fallback climate.%s failed for %s: %s", service, entity_id, e
-            )
+        # After turning on, check and set hvac_mode if needed
+        # Wait briefly for state to update
+        await asyncio.sleep(0.2)
+        state = self.coordinator.hass.states.get(entity_id)
+        desired_mode = getattr(self.coordinator, "season_mode", "cool")
+        if state:
+            current_mode = state.attributes.get("hvac_mode")
+            if current_mode != desired_mode:
+                await self.coordinator.hass.services.async_call(
+                    "climate",
+                    "set_hvac_mode",
+                    {"entity_id": entity_id, "hvac_mode": desired_mode},
+                    blocking=True,
+                )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any
 
 from homeassistant.components.binary_sensor import (
@@ -8,13 +9,14 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_ON
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import dt as dt_util
 
-from .const import CONF_AC_SWITCH, CONF_ZONES, DOMAIN, SolarACData
+from .const import DOMAIN, SolarACData
+from .coordinator import _BAD_STATES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -120,8 +122,8 @@ class SolarACShortCycleBinarySensor(_BaseSolarACBinary):
     @property
     def is_on(self) -> bool:
         # Note: This will only update when the coordinator updates.
-        now = dt_util.utcnow().timestamp()
-        for z in self.coordinator.config.get(CONF_ZONES, []):
+        now = time.monotonic()
+        for z in self.coordinator._zones:
             if last := self.coordinator.zone_last_changed.get(z):
                 threshold = (
                     self.coordinator.short_cycle_on_seconds
@@ -144,7 +146,7 @@ class SolarACLockedBinarySensor(_BaseSolarACBinary):
 
     @property
     def is_on(self) -> bool:
-        now = dt_util.utcnow().timestamp()
+        now = time.monotonic()
         return any(
             until and until > now
             for until in self.coordinator.zone_manual_lock_until.values()
@@ -189,13 +191,14 @@ class SolarACMasterBinarySensor(_BaseSolarACBinary):
 
     @property
     def is_on(self) -> bool:
-        ac_switch = self.coordinator.config.get(CONF_AC_SWITCH)
+        ac_switch = self.coordinator._ac_switch_id
         if not ac_switch:
             return True
-        state = self.coordinator.hass.states.get(ac_switch)
+        # Kept current by the coordinator's state listener
+        state = self.coordinator.get_tracked_state(ac_switch)
         if state is None:
             # Entity not yet available; treat as off for safety
             return False
-        if state.state in ("unavailable", "unknown"):
+        if state.state in _BAD_STATES:
             return False
-        return state.state == "on"
+        return state.state == STATE_ON
@@ -1,7 +1,8 @@
 # custom_components/solar_ac_controller/config_manager.py
 """Configuration management utilities for Solar AC Controller."""
 
-from typing import Any, Dict, List, Optional
+from collections import ChainMap
+from typing import Any, Dict, List, Mapping, Optional
 
 from homeassistant.config_entries import ConfigEntry
 
@@ -13,7 +14,9 @@ class ConfigManager:
         """Initialize config manager."""
         self.data = config_entry.data
         self.options = config_entry.options
-        self._config = {**dict(self.data), **dict(self.options)}
+        # Options win over data; chained rather than merged so nothing is
+        # copied (an options change reloads the entry and rebuilds this)
+        self._config = ChainMap(self.options, self.data)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value with fallback to default."""
@@ -22,21 +25,21 @@ class ConfigManager:
     def get_float(self, key: str, default: float) -> float:
         """Get configuration value as float."""
         try:
-            return float(self.options.get(key, self.data.get(key, default)))
+            return float(self._config.get(key, default))
         except (TypeError, ValueError):
             return default
 
     def get_int(self, key: str, default: int) -> int:
         """Get configuration value as int."""
         try:
-            return int(self.options.get(key, self.data.get(key, default)))
+            return int(self._config.get(key, default))
         except (TypeError, ValueError):
             return default
 
     def get_bool(self, key: str, default: bool) -> bool:
         """Get configuration value as bool."""
         try:
-            return bool(self.options.get(key, self.data.get(key, default)))
+            return bool(self._config.get(key, default))
         except (TypeError, ValueError):
             return default
 
@@ -44,7 +47,7 @@ class ConfigManager:
         """Get configuration value as list."""
         if default is None:
             default = []
-        value = self.options.get(key, self.data.get(key, default))
+        value = self._config.get(key, default)
         if isinstance(value, list):
             return value
         if isinstance(value, str):
@@ -56,10 +59,10 @@ class ConfigManager:
         """Get configuration value as dict."""
         if default is None:
             default = {}
-        value = self.options.get(key, self.data.get(key, default))
+        value = self._config.get(key, default)
         return value if isinstance(value, dict) else default
 
     @property
-    def config(self) -> Dict[str, Any]:
-        """Get the combined config dict."""
-        return self._config.copy()
+    def config(self) -> Mapping[str, Any]:
+        """Get the combined, read-only config view."""
+        return self._config
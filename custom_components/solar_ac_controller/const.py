@@ -45,6 +45,11 @@ CONF_REMOVE_CONFIDENCE = "remove_confidence"
 # Learning system
 CONF_INITIAL_LEARNED_POWER = "initial_learned_power"
 
+# Learned power modes (keys of each per-zone learned_power entry)
+MODE_DEFAULT = "default"
+MODE_HEAT = "heat"
+MODE_COOL = "cool"
+
 # Comfort/zone temperature targets
 CONF_MAX_TEMP_WINTER = "max_temp_winter"
 CONF_MIN_TEMP_SUMMER = "min_temp_summer"
@@ -3,10 +3,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from typing import Any, Awaitable, Callable, cast
 
 from homeassistant.core import HomeAssistant
-from homeassistant.util import dt as dt_util
+
+from .const import MODE_COOL, MODE_DEFAULT, MODE_HEAT
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,7 +52,7 @@ class SolarACController:
 
             self.coordinator.learning_active = True
             self.coordinator.learning_zone = zone_entity_id
-            self.coordinator.learning_start_time = dt_util.utcnow().timestamp()
+            self.coordinator.learning_start_time = time.monotonic()
             self.coordinator.ac_power_before = baseline
 
             _LOGGER.debug(
@@ -60,12 +62,12 @@ class SolarACController:
             )
             # Enhanced logging for learning start
             log_fn = cast(
-                Callable[[str], Awaitable[None]] | None,
+                Callable[[str], None] | None,
                 getattr(self.coordinator, "_log", None),
             )
             if log_fn:
                 try:
-                    await log_fn(
+                    log_fn(
                         f"[LEARNING_START] zone={zone_entity_id} "
                         f"ac_before={round(self.coordinator.ac_power_before or 0, 2)}W "
                         f"mode={getattr(self.coordinator, 'season_mode', 'unknown')}"
@@ -119,7 +121,7 @@ class SolarACController:
                 await self._reset_learning_state_async()
                 return
 
-            zone_name = zone.split(".")[-1]
+            zone_name = self.coordinator._zone_name(zone)
             zone_state_obj = self.hass.states.get(zone)
             mode = None
             if zone_state_obj:
@@ -127,22 +129,22 @@ class SolarACController:
                     "hvac_mode"
                 ) or zone_state_obj.attributes.get("hvac_action")
                 if isinstance(hvac_mode, str):
-                    if "heat" in hvac_mode:
-                        mode = "heat"
-                    elif "cool" in hvac_mode:
-                        mode = "cool"
+                    if MODE_HEAT in hvac_mode:
+                        mode = MODE_HEAT
+                    elif MODE_COOL in hvac_mode:
+                        mode = MODE_COOL
                 else:
-                    if zone_state_obj.state == "heat":
-                        mode = "heat"
-                    elif zone_state_obj.state == "cool":
-                        mode = "cool"
+                    if zone_state_obj.state == MODE_HEAT:
+                        mode = MODE_HEAT
+                    elif zone_state_obj.state == MODE_COOL:
+                        mode = MODE_COOL
 
             set_lp = getattr(self.coordinator, "set_learned_power", None)
-            persist_fn = cast(
-                Callable[[], Awaitable[None]] | None,
-                getattr(self.coordinator, "async_persist_learned_values", None),
+            schedule_persist = cast(
+                Callable[[], None] | None,
+                getattr(self.coordinator, "schedule_persist_learned_values", None),
             )
-            if not (set_lp and callable(set_lp)) or not persist_fn:
+            if not (set_lp and callable(set_lp)) or not schedule_persist:
                 _LOGGER.error(
                     "Coordinator missing required persistence API; aborting learning save"
                 )
@@ -157,31 +159,24 @@ class SolarACController:
 
             try:
                 set_lp(zone_name, float(delta), mode=mode)
-                self.coordinator.samples = (
-                    int(getattr(self.coordinator, "samples", 0) or 0) + 1
-                )
-                persist_fn = cast(
-                    Callable[[], Awaitable[None]] | None,
-                    getattr(self.coordinator, "async_persist_learned_values", None),
-                )
-                if persist_fn:
-                    await persist_fn()
+                self.coordinator.bump_samples()
+                schedule_persist()
                 _LOGGER.info(
                     "Finished learning: zone=%s mode=%s delta=%s samples=%s",
                     zone,
-                    mode or "default",
+                    mode or MODE_DEFAULT,
                     round(delta, 2),
                     self.coordinator.samples,
                 )
                 # Enhanced logging for learning completion
                 log_fn = cast(
-                    Callable[[str], Awaitable[None]] | None,
+                    Callable[[str], None] | None,
                     getattr(self.coordinator, "_log", None),
                 )
                 if log_fn:
                     try:
-                        await log_fn(
-                            f"[LEARNING_COMPLETE] zone={zone} mode={mode or 'default'} "
+                        log_fn(
+                            f"[LEARNING_COMPLETE] zone={zone} mode={mode or MODE_DEFAULT} "
                             f"ac_before={round(ac_before, 2)}W ac_after={round(ac_power_now, 2)}W "
                             f"delta={round(delta, 2)}W samples={self.coordinator.samples}"
                         )
@@ -193,12 +188,12 @@ class SolarACController:
             except Exception as exc:
                 _LOGGER.exception("Error finishing learning for %s: %s", zone, exc)
                 log_fn = cast(
-                    Callable[[str], Awaitable[None]] | None,
+                    Callable[[str], None] | None,
                     getattr(self.coordinator, "_log", None),
                 )
                 if log_fn:
                     try:
-                        await log_fn(f"[LEARNING_SAVE_ERROR] zone={zone} err={exc}")
+                        log_fn(f"[LEARNING_SAVE_ERROR] zone={zone} err={exc}")
                     except Exception as exc2:
                         _LOGGER.exception(
                             "Failed to write learning error to coordinator log: %s",
@@ -209,6 +204,8 @@ class SolarACController:
     async def reset_learning(self) -> None:
         self.coordinator.learned_power = {}
         self.coordinator.samples = 0
+        self.coordinator.mark_learned_values_dirty()
+        self.coordinator.invalidate_balanced_decision()
         persist_fn = cast(
             Callable[[], Awaitable[None]] | None,
             getattr(self.coordinator, "async_persist_learned_values", None),
@@ -220,18 +217,17 @@ class SolarACController:
             return
 
         try:
-            if persist_fn:
-                await persist_fn()
+            await persist_fn()
             _LOGGER.info("Controller: reset learning and persisted empty learned_power")
         except Exception as exc:
             _LOGGER.exception("Controller: failed to persist reset learning: %s", exc)
             log_fn = cast(
-                Callable[[str], Awaitable[None]] | None,
+                Callable[[str], None] | None,
                 getattr(self.coordinator, "_log", None),
             )
             if log_fn:
                 try:
-                    await log_fn(f"[SERVICE_ERROR] reset_learning {exc}")
+                    log_fn(f"[SERVICE_ERROR] reset_learning {exc}")
                 except Exception:
                     _LOGGER.exception(
                         "Failed to write service error to coordinator log"
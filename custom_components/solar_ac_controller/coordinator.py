@@ -1,13 +1,21 @@
 # custom_components/solar_ac_controller/coordinator.py
 from __future__ import annotations
 
+import asyncio
 import logging
+import operator
+import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import timedelta
-from typing import Any, Dict, Optional
+from functools import cached_property, partial
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional
 
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, STATE_OFF, STATE_ON
+from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.util import dt as dt_util
 
 from .actions import ActionExecutor
 from .config_manager import ConfigManager
@@ -48,28 +56,186 @@ from .const import (
     DEFAULT_SOLAR_THRESHOLD_OFF,
     DEFAULT_SOLAR_THRESHOLD_ON,
     DOMAIN,
+    MODE_COOL,
+    MODE_DEFAULT,
+    MODE_HEAT,
 )
 from .decisions import DecisionEngine
 from .exceptions import SensorInvalidError, SensorUnavailableError
+from .helpers import _normalize_learned_entry
 from .metrics import MetricsCollector
 from .panic import PanicManager
 from .storage_circuit_breaker import StorageCircuitBreaker
 from .zone_config_parser import ZoneConfigParser
 from .zones import ZoneManager
 
+if TYPE_CHECKING:
+    from .controller import SolarACController
+
 # Type aliases for better readability
 LearnedPowerData = Dict[str, Dict[str, float]]
 ZoneMapping = Dict[str, str]
 ZoneStates = Dict[str, Any]
 ZoneLocks = Dict[str, Optional[float]]
-SensorStates = Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class CoordinatorSnapshot:
+    """Entity-visible coordinator state returned by each update.
+
+    With always_update=False, listeners are only called when this changes, so
+    it holds every value entity states show, at the precision they show it.
+    The diagnostics sensor's attributes are not tracked here and refresh only
+    along with one of these values.
+    """
+
+    integration_enabled: bool
+    season_mode: str
+    last_action: str | None
+    note: str
+    next_zone: str | None
+    last_zone: str | None
+    zone_states: tuple[str | None, ...]
+    master_on: bool
+    ema_30s: float
+    ema_5m: float
+    exporting: bool
+    importing: bool
+    confidence: float
+    required_export: float | None
+    export_margin: float | None
+    samples: int
+    learned_power: tuple[float, ...]
+    learning_active: bool
+    panic_cooldown: bool
+    guard_until: float
+
 
 _LOGGER = logging.getLogger(__name__)
 
 _EMA_RESET_AFTER_OFF_SECONDS = 600
 
+# EMA decay per nominal 5s sample; scaled by the actual gap between samples
+_EMA_SAMPLE_SECONDS = 5.0
+_EMA_30S_DECAY = 0.75
+_EMA_5M_DECAY = 0.97
+_EMA_30S_ALPHA = 1.0 - _EMA_30S_DECAY
+_EMA_5M_ALPHA = 1.0 - _EMA_5M_DECAY
+# Scheduling jitter within which a tick counts as exactly one sample period
+_EMA_JITTER_S = 0.25
+
+# A balanced decision is only reused once both EMAs sit this close to the raw
+# grid reading, so a skipped cycle could not have reached a different decision
+_SKIP_EMA_TOLERANCE_W = 1.0
+
+# States that carry no numeric reading; checked before float() so the common
+# disconnect path does not go through exception handling.
+_BAD_STATES = frozenset(("unknown", "unavailable", ""))
+
+# Master switch states that count as a definite on/off position
+_SWITCH_STATES = frozenset((STATE_ON, STATE_OFF))
+# A master switch request not confirmed by a state change within this many
+# seconds is dropped, so the switch is driven again
+_MASTER_CONFIRM_TIMEOUT_S = 30.0
+
+# Master switch log formats (printf-style, formatted only when emitted)
+_LOG_MASTER_ON = (
+    "[MASTER_ON] solar=%sW >= threshold_on=%sW, turning AC master switch ON"
+)
+_LOG_MASTER_OFF = (
+    "[MASTER_OFF_TRIGGER] solar=%sW <= threshold_off=%sW, turning AC master switch OFF"
+)
+_LOG_MASTER_RELEASE_ON = (
+    "[MASTER_LOCK_RELEASE] solar=%s >= threshold_on=%s, resuming auto-control"
+)
+_LOG_MASTER_RELEASE_OFF = (
+    "[MASTER_LOCK_RELEASE] solar=%s <= threshold_off=%s, resuming auto-control"
+)
+_LOG_MASTER_MANUAL_LOCK = (
+    "[MASTER_MANUAL_LOCK] detected manual change to %s, "
+    "locking until natural cycle aligns"
+)
 
-class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
+# Master switch auto-control, keyed by the target state (solar above the ON
+# threshold or below the OFF one): (service, resulting state, last_action,
+# switch log format, lock release log format)
+_MASTER_ACTIONS = {
+    True: ("turn_on", STATE_ON, "master_on", _LOG_MASTER_ON, _LOG_MASTER_RELEASE_ON),
+    False: (
+        "turn_off",
+        STATE_OFF,
+        "master_off",
+        _LOG_MASTER_OFF,
+        _LOG_MASTER_RELEASE_OFF,
+    ),
+}
+
+# Learned power sample filtering: absolute bounds for a single zone's
+# incremental draw (W), accepted deviation from the current value (fraction)
+# and smoothing factor for accepted samples
+_LP_MIN_W = 200.0
+_LP_MAX_W = 3000.0
+_LP_REL_TOL = 0.5
+_LP_ALPHA = 0.3
+
+# Polling cadence: every evaluated cycle runs at the base interval; balanced
+# cycles stretch it in proportion to how far export is from the next zone's need
+_UPDATE_INTERVAL = timedelta(seconds=5)
+_MAX_UPDATE_SECONDS = 30
+_MIN_MARGIN_SCALE_W = 100.0
+# Grid movement around an importing balanced reading that is treated as noise
+_IMPORT_HYSTERESIS_W = 100.0
+# Longest a balanced decision is reused without a full evaluation, so a change
+# outside the tracked entities is picked up even when no guard is pending
+_BALANCED_RECHECK_SECONDS = 300.0
+# Fallback poll while a power sensor is unavailable; its recovery triggers a
+# refresh through the state listener
+_OUTAGE_UPDATE_INTERVAL = timedelta(seconds=60)
+
+# required_export_source shown after the previous cycle ended in these actions
+_EXPORT_SOURCE_BY_ACTION = {
+    "panic_cooldown": "Panic Recovery",
+    "integration_disabled": "Integration Disabled",
+    "solar_too_low": "Solar Freeze",
+}
+
+# Trailing window over which learned-value saves are coalesced into one write
+_PERSIST_DELAY_SECONDS = 5.0
+
+
+def _state_watts(state: State | None) -> float | None:
+    """Return the numeric reading of a power sensor state, or None."""
+    if state is None or state.state in _BAD_STATES:
+        return None
+    try:
+        return float(state.state)
+    except ValueError:
+        return None
+
+
+def _ema_step(
+    grid_raw: float, ema_30s: float, ema_5m: float, steps: float = 1.0
+) -> tuple[float, float]:
+    """Advance both grid EMAs by `steps` nominal sample periods.
+
+    Pure scalar kernel kept free of coordinator state.
+    """
+    a30 = 1.0 - _EMA_30S_DECAY**steps
+    a5m = 1.0 - _EMA_5M_DECAY**steps
+    return ema_30s + a30 * (grid_raw - ema_30s), ema_5m + a5m * (grid_raw - ema_5m)
+
+
+def _round_watts(value: Any) -> Any:
+    """Round a power value to whole watts, passing non-numeric values through."""
+    if type(value) is float:
+        return round(value)
+    try:
+        return int(round(float(value)))
+    except Exception:
+        return value
+
+
+class SolarACCoordinator(DataUpdateCoordinator[CoordinatorSnapshot]):
     """Coordinator for Solar AC Controller integration."""
 
     note: str = ""  # Breadcrumb for diagnostics
@@ -77,7 +243,8 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
     async def async_set_integration_enabled(self, enabled: bool) -> None:
         """Update and persist integration state."""
         self.integration_enabled = enabled
-        await self._log(f"Integration {'enabled' if enabled else 'disabled'} by user.")
+        self.invalidate_balanced_decision()
+        self._log(f"Integration {'enabled' if enabled else 'disabled'} by user.")
         self.stored_data["integration_enabled"] = enabled
         await self.store.async_save(self.stored_data)
         self.async_update_listeners()
@@ -85,9 +252,7 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
     async def async_set_activity_logging_enabled(self, enabled: bool) -> None:
         """Toggle activity logging and persist state."""
         self.activity_logging_enabled = enabled
-        await self._log(
-            f"Activity logging {'enabled' if enabled else 'disabled'} by user."
-        )
+        self._log(f"Activity logging {'enabled' if enabled else 'disabled'} by user.")
         self.stored_data["activity_logging_enabled"] = enabled
 
         if not self.storage_circuit_breaker.should_attempt_operation():
@@ -117,11 +282,11 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
             hass,
             logger=_LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=5),
+            update_interval=_UPDATE_INTERVAL,
+            always_update=False,
         )
 
         # Basic initialization
-        self.hass = hass
         self.config_entry = config_entry
         self.config_manager = ConfigManager(config_entry)
         self.config = self.config_manager.config
@@ -143,31 +308,43 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
             "activity_logging_enabled", False
         )
 
-        # Initialize core components
-        self._init_core_components()
-
         # Initialize configuration values
         self._init_config_values()
 
         # Initialize zone mappings
         self._init_zone_mappings()
 
+        # Subscribe to state changes of the entities read every cycle
+        self._init_state_tracking()
+
         # Initialize learned data from storage
         self._init_learned_data(stored)
 
         # Initialize runtime state
         self._init_runtime_state()
 
+        # Restore the master switch manual lock before the first cycle can act
+        self._restore_master_state()
+
+        # Flush a pending learned-value save on unload and on shutdown
+        config_entry.async_on_unload(self.async_flush_learned_values)
+        config_entry.async_on_unload(
+            hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STOP, self._async_handle_hass_stop
+            )
+        )
+        # Drop a panic still waiting out its delay when the entry unloads
+        # (only if the panic manager was ever built)
+        config_entry.async_on_unload(
+            lambda: "panic_manager" in self.__dict__ and self.panic_manager.cancel()
+        )
+
         # Season mode (manual selection: heat or cool)
 
     @property
     def season_mode(self) -> str:
-        # Check runtime value first, then stored data, then config
-        if hasattr(self, "_season_mode"):
-            return self._season_mode
-        return self.stored_data.get("season_mode") or self.config_manager.get(
-            CONF_SEASON_MODE, DEFAULT_SEASON_MODE
-        )
+        # Resolved from stored data (with config fallback) in __init__
+        return self._season_mode
 
     @season_mode.setter
     def season_mode(self, value: str):
@@ -177,6 +354,7 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
     async def async_set_season_mode(self, value: str) -> None:
         """Set season mode and persist state."""
         self.season_mode = value
+        self.invalidate_balanced_decision()
         self.stored_data["season_mode"] = value
 
         if not self.storage_circuit_breaker.should_attempt_operation():
@@ -203,46 +381,99 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
 
         # Master AC control state
         self.master_last_state = None
-        self.master_last_action_time = None
         self.master_manual_lock_state = None
+        # Context ids of our own master switch calls, so their state changes
+        # are not taken for manual ones, and the state requested by the call
+        # still in flight (cleared by the next real switch state change)
+        self._own_contexts: deque[str] = deque(maxlen=32)
+        self._desired_master: str | None = None
+        self._desired_master_until = 0.0  # monotonic
+        # Side of the band (True = ON) the manual lock was last checked on
+        self._lock_checked_side: bool | None = None
         self.required_export = None
         self.export_margin = None
-        self.master_off_since = None
+        self.master_off_since = None  # monotonic
 
-        # Controller and confidence tracking
-        from .controller import SolarACController
+        # Entities whose own domain service failed but climate.* worked, and
+        # the bound service calls per (domain, service, entity)
+        self._fallback_entities: set[str] = set()
+        self._service_calls: dict[
+            tuple[str, str, str], Callable[[], Awaitable[Any]]
+        ] = {}
 
-        self.controller = SolarACController(self.hass, self, self.store)
+        # Confidence tracking
         self.last_add_conf = 0.0
         self.last_remove_conf = 0.0
         self.confidence = 0.0
-        self.last_action_start_ts = None
+        self.last_action_start_ts = None  # monotonic
         self.last_action_duration = None
         self._panic_task = None
-        self.last_panic_ts = None
+        self.last_panic_ts = None  # monotonic
+        # End of the post-action settle delay (monotonic)
+        self._settle_until = 0.0
 
         # Learning state
         self.last_action = None
         self.was_in_freeze = False  # Track previous freeze state for logging
         self.learning_active = False
-        self.learning_start_time = None
+        self.learning_start_time = None  # monotonic
         self.ac_power_before = None
         self.learning_zone = None
         self.ema_30s = 0.0
         self.ema_5m = 0.0
+        self._last_ema_ts: float | None = None
+        self._tick_now = time.monotonic()  # set at the start of each cycle
+        self._ema_reset_while_off = False
+
+        # Cycle skipping: whether the last balanced decision still holds, and
+        # when it must be re-evaluated regardless
+        self._balanced = False
+        self._balanced_until = 0.0
+        # Grid readings within which the last balanced decision holds
+        self._grid_band = (0.0, 0.0)
+        self._balanced_note_sig: tuple[int, int, int, int] | None = None
+        self._balanced_note: str | None = None
+        # Power sensor that failed the last read, and the one the polling
+        # back-off is waiting on
+        self._failed_sensor_id: str | None = None
+        self._outage_entity: str | None = None
 
         # Defensive initialization
         self.required_export_source = "Initializing"
 
-    def _init_core_components(self) -> None:
-        """Initialize core component instances."""
-        self.zone_manager = ZoneManager(self)
-        self.panic_manager = PanicManager(self)
-        self.decision_engine = DecisionEngine(self)
-        self.action_executor = ActionExecutor(self)
+    # Core components are built on first use
+    @cached_property
+    def zone_manager(self) -> ZoneManager:
+        return ZoneManager(self)
+
+    @cached_property
+    def panic_manager(self) -> PanicManager:
+        return PanicManager(self)
+
+    @cached_property
+    def decision_engine(self) -> DecisionEngine:
+        return DecisionEngine(self)
+
+    @cached_property
+    def action_executor(self) -> ActionExecutor:
+        return ActionExecutor(self)
+
+    @cached_property
+    def controller(self) -> SolarACController:
+        from .controller import SolarACController
+
+        return SolarACController(self.hass, self, self.store)
 
     def _init_config_values(self) -> None:
         """Initialize configuration-derived values."""
+        # Input entity ids (options changes reload the entry, so resolve once)
+        self._grid_id = self.config_manager.get(CONF_GRID_SENSOR)
+        self._solar_id = self.config_manager.get(CONF_SOLAR_SENSOR)
+        self._ac_power_id = self.config_manager.get(CONF_AC_POWER_SENSOR)
+        self._ac_switch_id = self.config_manager.get(CONF_AC_SWITCH)
+        # Service data reused for every master switch call; HA copies it
+        self._master_payload = {"entity_id": self._ac_switch_id}
+
         # Enable temperature modulation
         self.enable_temp_modulation = self.config_manager.get_bool(
             CONF_ENABLE_TEMP_MODULATION, DEFAULT_ENABLE_TEMP_MODULATION
@@ -256,6 +487,14 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
             CONF_MIN_TEMP_SUMMER, DEFAULT_MIN_TEMP_SUMMER
         )
 
+        # Master switch solar thresholds (W)
+        self.solar_threshold_on = self.config_manager.get_float(
+            CONF_SOLAR_THRESHOLD_ON, DEFAULT_SOLAR_THRESHOLD_ON
+        )
+        self.solar_threshold_off = self.config_manager.get_float(
+            CONF_SOLAR_THRESHOLD_OFF, DEFAULT_SOLAR_THRESHOLD_OFF
+        )
+
         # Operational thresholds
         self.panic_threshold = self.config_manager.get_float(
             CONF_PANIC_THRESHOLD, DEFAULT_PANIC_THRESHOLD
@@ -296,6 +535,188 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
         self.zone_manual_power = ZoneConfigParser.parse_manual_power(
             self.config_entry, zones_list
         )
+        # Entity id parts used on every decision and service call
+        self._zones = tuple(zones_list)
+        self._zone_name_by_id = {z: z.rpartition(".")[2] for z in zones_list}
+        self._domain_by_entity = {z: z.partition(".")[0] for z in zones_list}
+        self._zone_payloads = {z: {"entity_id": z} for z in zones_list}
+        # Fixed iteration order for _read_zone_temps; the result dict is reused
+        self._zone_temp_pairs = tuple(self.zone_temp_sensors.items())
+        self.zone_current_temps: dict[str, float | None] = {}
+
+    def _init_state_tracking(self) -> None:
+        """Cache the latest state of every entity read by the update loop.
+
+        The cache is seeded from the state machine once and then kept current by
+        a state-change listener, so each cycle reads local dict entries instead
+        of polling hass.states.
+        """
+        tracked = {
+            entity_id
+            for entity_id in (
+                self._grid_id,
+                self._solar_id,
+                self._ac_power_id,
+                self._ac_switch_id,
+                *self._zones,
+                *self.zone_temp_sensors.values(),
+            )
+            if entity_id
+        }
+        self._state_cache: dict[str, State | None] = {
+            entity_id: self.hass.states.get(entity_id) for entity_id in tracked
+        }
+        self._set_master_flags(self._state_cache.get(self._ac_switch_id))
+        if tracked:
+            self.config_entry.async_on_unload(
+                async_track_state_change_event(
+                    self.hass, list(tracked), self._async_handle_tracked_state
+                )
+            )
+
+    @callback
+    def _async_handle_tracked_state(self, event: Event) -> None:
+        """Store the new state of a tracked entity.
+
+        Power readings only invalidate the balanced decision when they could
+        change it; AC power only matters while learning, which never skips.
+        """
+        entity_id = event.data["entity_id"]
+        new_state = event.data["new_state"]
+        self._state_cache[entity_id] = new_state
+        if entity_id == self._ac_switch_id:
+            self.invalidate_balanced_decision()
+            self._set_master_flags(new_state)
+            self._track_master_change(event)
+        elif (
+            entity_id == self._outage_entity
+            and new_state is not None
+            and new_state.state not in _BAD_STATES
+        ):
+            # The failed power sensor is back: resume the base cadence now
+            self.invalidate_balanced_decision()
+            self._outage_entity = None
+            self.update_interval = _UPDATE_INTERVAL
+            self.hass.async_create_task(
+                self.async_request_refresh(), name="solar_ac_sensor_recovered"
+            )
+        elif entity_id == self._grid_id or entity_id == self._solar_id:
+            if not self._input_change_matters(
+                entity_id, event.data["old_state"], new_state
+            ):
+                return
+            self.invalidate_balanced_decision()
+            if self._outage_entity is None and self.update_interval != _UPDATE_INTERVAL:
+                # Stretched balanced polling must not delay an import spike
+                self.update_interval = _UPDATE_INTERVAL
+                self.hass.async_create_task(
+                    self.async_request_refresh(), name="solar_ac_input_changed"
+                )
+        elif entity_id != self._ac_power_id:
+            self.invalidate_balanced_decision()
+
+    def _input_change_matters(
+        self, entity_id: str, old_state: State | None, new_state: State | None
+    ) -> bool:
+        """Return True if a grid or solar reading may change the decision.
+
+        Grid counts once it leaves the band recorded by the last balanced
+        cycle; solar once it crosses a master switch or freeze threshold.
+        Readings that are not numbers always count.
+        """
+        value = _state_watts(new_state)
+        if value is None:
+            return True
+        if entity_id == self._grid_id:
+            low, high = self._grid_band
+            return not low < value < high
+        old = _state_watts(old_state)
+        return old is None or self._solar_side(old) != self._solar_side(value)
+
+    def _solar_side(self, solar: float) -> int:
+        """Return which side of the master switch hysteresis band solar is on."""
+        if solar <= self.solar_threshold_off:
+            return -1
+        return 1 if solar >= self.solar_threshold_on else 0
+
+    def _grid_wake_band(
+        self, grid_raw: float, required_export: float | None
+    ) -> tuple[float, float]:
+        """Return the grid readings within which a balanced decision holds.
+
+        While exporting, adding needs export to cover the next zone and
+        removal or panic needs import, so the band runs from that need to
+        zero. While importing, it is the hysteresis around the reading,
+        bounded by zero and the panic threshold.
+        """
+        if grid_raw <= 0:
+            if required_export is None:
+                return float("-inf"), 0.0
+            return -required_export, 0.0
+        return (
+            max(0.0, grid_raw - _IMPORT_HYSTERESIS_W),
+            min(self.panic_threshold, grid_raw + _IMPORT_HYSTERESIS_W),
+        )
+
+    def _set_master_flags(self, state: State | None) -> None:
+        """Record whether the master switch is on or off (both False if unknown)."""
+        value = state.state if state is not None else None
+        self._master_on = value == STATE_ON
+        self._master_off = value == STATE_OFF
+
+    def _track_master_change(self, event: Event) -> None:
+        """Lock auto-control when someone else switches the master on or off.
+
+        Our own calls are recognised by their context id; a switch that
+        reports the requested state later under its own context also counts.
+        """
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        if old_state is None or new_state is None:
+            return
+        old, value = old_state.state, new_state.state
+        if old == value:
+            return
+        self.master_last_state = value
+        requested, self._desired_master = self._desired_master, None
+        if old not in _SWITCH_STATES or value not in _SWITCH_STATES:
+            return
+        if event.context.id in self._own_contexts or value == requested:
+            return
+        self.master_manual_lock_state = value
+        self._lock_checked_side = None
+        self._log(_LOG_MASTER_MANUAL_LOCK, value)
+        self._schedule_master_save()
+
+    def _restore_master_state(self) -> None:
+        """Restore the master switch manual lock saved before a restart."""
+        lock = self.stored_data.get("master_manual_lock_state")
+        if lock in _SWITCH_STATES:
+            self.master_manual_lock_state = lock
+        last = self.stored_data.get("master_last_state")
+        if isinstance(last, str):
+            self.master_last_state = last
+
+    @callback
+    def _schedule_master_save(self) -> None:
+        """Save the master switch lock with the next learned-value save."""
+        self.mark_learned_values_dirty()
+        self.schedule_persist_learned_values()
+
+    def _zone_name(self, entity_id: str) -> str:
+        """Return the object id of a zone entity (the learned power key)."""
+        return self._zone_name_by_id.get(entity_id) or entity_id.rpartition(".")[2]
+
+    def _entity_domain(self, entity_id: str) -> str:
+        """Return the domain of an entity id."""
+        return self._domain_by_entity.get(entity_id) or entity_id.partition(".")[0]
+
+    def get_tracked_state(self, entity_id: str) -> State | None:
+        """Return the latest state of an entity, preferring the listener cache."""
+        try:
+            return self._state_cache[entity_id]
+        except KeyError:
+            return self.hass.states.get(entity_id)
 
     def _init_learned_data(self, stored: Optional[Dict[str, Any]]) -> None:
         """Initialize learned power data from storage."""
@@ -303,37 +724,29 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
         raw_learned = stored.get("learned_power", {}) or {}
         raw_samples = stored.get("samples", 0) or 0
 
-        self.learned_power = {}
         self.samples = int(raw_samples)
+        self._lp_dirty = False
+        # (learned_power, samples, master lock, master state) as last written,
+        # to skip identical saves
+        self._last_saved_payload: Optional[
+            tuple[Dict[str, Any], int, str | None, str | None]
+        ] = None
+        self._persist_debouncer: Debouncer[Awaitable[None]] = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=_PERSIST_DELAY_SECONDS,
+            immediate=False,
+            function=self.async_persist_learned_values,
+        )
 
+        # Keyed by zone name rather than config index: entries outlive zone
+        # list edits and are saved as-is, and each holds a handful of floats
         if isinstance(raw_learned, dict):
-            for zone_name, val in raw_learned.items():
-                if isinstance(val, (int, float)):
-                    v = float(val)
-                    self.learned_power[zone_name] = {"default": v, "heat": v, "cool": v}
-                elif isinstance(val, dict):
-                    normalized = {}
-                    for k, vv in val.items():
-                        try:
-                            normalized[k.lower()] = float(vv)
-                        except Exception:
-                            continue
-                    if "default" not in normalized:
-                        normalized["default"] = normalized.get(
-                            "heat",
-                            normalized.get("cool", float(self.initial_learned_power)),
-                        )
-                    if "heat" not in normalized:
-                        normalized["heat"] = normalized["default"]
-                    if "cool" not in normalized:
-                        normalized["cool"] = normalized["default"]
-                    self.learned_power[zone_name] = normalized
-                else:
-                    self.learned_power[zone_name] = {
-                        "default": float(self.initial_learned_power),
-                        "heat": float(self.initial_learned_power),
-                        "cool": float(self.initial_learned_power),
-                    }
+            initial = float(self.initial_learned_power)
+            self.learned_power = {
+                zone_name: _normalize_learned_entry(val, initial)
+                for zone_name, val in raw_learned.items()
+            }
         else:
             self.learned_power = {}
 
@@ -346,27 +759,18 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
         mode: Optional[str] = None,
         band: Optional[str] = None,
     ) -> float:
-        """Return learned power for a zone and mode/band, or default if missing."""
+        """Return learned power for a zone and mode/band, or default if missing.
+
+        Entries are normalized to dicts of floats when loaded and by
+        set_learned_power, so values are returned without re-validation.
+        """
         entry = self.learned_power.get(zone_name)
         if entry is None:
-            return float(self.initial_learned_power)
-        if isinstance(entry, dict):
-            val = None
-            if mode and mode in entry:
-                val = entry.get(mode)
-            elif "default" in entry:
-                val = entry.get("default")
-            elif "heat" in entry:
-                val = entry.get("heat")
-            elif "cool" in entry:
-                val = entry.get("cool")
-            if val is not None:
-                return float(val)
-            return float(self.initial_learned_power)
-        try:
-            return float(entry)
-        except Exception:
-            return float(self.initial_learned_power)
+            return self.initial_learned_power
+        # Entries always carry default/heat/cool, so at most two probes
+        if mode and (val := entry.get(mode)) is not None:
+            return val
+        return entry.get(MODE_DEFAULT, self.initial_learned_power)
 
     def set_learned_power(
         self,
@@ -386,56 +790,33 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
         except (TypeError, ValueError):
             return
 
-        # Reasonable absolute bounds for a single zone incremental draw (W)
-        MIN_W = 200.0
-        MAX_W = 3000.0
-        # Relative tolerance around existing learned value (± fraction)
-        REL_TOL = 0.5  # accept within ±50% of current learned value
-        # Smoothing factor for EMA update
-        ALPHA = 0.3
-
-        # Initialize zone entry if missing
-
-        if zone_name not in self.learned_power or not isinstance(
-            self.learned_power.get(zone_name), dict
-        ):
-            val = self.learned_power.get(zone_name)
-            if isinstance(val, (int, float)):
-                base = float(val)
-            else:
-                base = float(self.initial_learned_power)
-            self.learned_power[zone_name] = {
-                "default": base,
-                "heat": base,
-                "cool": base,
+        # Entries are normalized dicts; a new zone starts complete as well
+        current = self.get_learned_power(zone_name, mode)
+        entry = self.learned_power.get(zone_name)
+        if entry is None:
+            entry = self.learned_power[zone_name] = {
+                MODE_DEFAULT: current,
+                MODE_HEAT: current,
+                MODE_COOL: current,
             }
 
-        entry = self.learned_power[zone_name]
-        val = entry.get(
-            mode or "default", entry.get("default", self.initial_learned_power)
-        )
-        if val is not None:
-            current = float(val)
-        else:
-            current = float(self.initial_learned_power)
-
         # Absolute outlier filter
-        if not (MIN_W <= new_sample <= MAX_W):
+        if not (_LP_MIN_W <= new_sample <= _LP_MAX_W):
             try:
                 _LOGGER.debug(
                     "Discarding outlier sample for %s: %sW outside [%s,%s]",
                     zone_name,
                     new_sample,
-                    MIN_W,
-                    MAX_W,
+                    _LP_MIN_W,
+                    _LP_MAX_W,
                 )
             except Exception:
                 pass
             return
 
         # Relative outlier filter (only apply if we have a meaningful current value)
-        lower = max(MIN_W, current * (1.0 - REL_TOL))
-        upper = min(MAX_W, current * (1.0 + REL_TOL))
+        lower = max(_LP_MIN_W, current * (1.0 - _LP_REL_TOL))
+        upper = min(_LP_MAX_W, current * (1.0 + _LP_REL_TOL))
         if not (lower <= new_sample <= upper):
             try:
                 _LOGGER.debug(
@@ -451,20 +832,49 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
             return
 
         # Smooth update
-        updated = (ALPHA * new_sample) + ((1.0 - ALPHA) * current)
-        updated = round(updated)  # store whole watts only
+        updated = (_LP_ALPHA * new_sample) + ((1.0 - _LP_ALPHA) * current)
+        updated = float(round(updated))  # store whole watts only
 
-        # Update mode-specific and default values
+        # Update mode-specific and default values; entries always carry heat
+        # and cool (normalized on load, created complete above)
         if mode:
-            entry[mode] = float(updated)
-        entry["default"] = float(updated)
-        if "heat" not in entry:
-            entry["heat"] = entry["default"]
-        if "cool" not in entry:
-            entry["cool"] = entry["default"]
+            entry[mode] = updated
+        entry[MODE_DEFAULT] = updated
+        self._lp_dirty = True
+
+    def bump_samples(self) -> None:
+        """Increment the learning sample counter."""
+        samples = self.samples
+        self.samples = (samples + 1) if isinstance(samples, int) else 1
+        self._lp_dirty = True
+
+    def mark_learned_values_dirty(self) -> None:
+        """Flag learned values as changed so the next save writes them."""
+        self._lp_dirty = True
+
+    @callback
+    def schedule_persist_learned_values(self) -> None:
+        """Save learned values after a short delay, coalescing repeat calls."""
+        self._persist_debouncer.async_schedule_call()
+
+    async def async_flush_learned_values(self) -> None:
+        """Write any pending learned values immediately."""
+        self._persist_debouncer.async_cancel()
+        await self.async_persist_learned_values()
+
+    async def _async_handle_hass_stop(self, event: Event) -> None:
+        """Flush pending learned values before Home Assistant stops."""
+        await self.async_flush_learned_values()
 
     async def async_persist_learned_values(self) -> None:
-        """Persist learned values to storage."""
+        """Persist learned values and the master switch lock to storage.
+
+        Skipped when nothing changed since the last successful save, or when
+        the rounded payload is identical to what is already on disk, to keep
+        flash writes down on SD-card installs.
+        """
+        if not self._lp_dirty:
+            return
         if not self.storage_circuit_breaker.should_attempt_operation():
             _LOGGER.warning(
                 "Storage circuit breaker open, skipping learned values save"
@@ -472,34 +882,72 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
             return
 
         try:
-            payload = {
-                "learned_power": self._rounded_power(self.learned_power),
-                "samples": int(self.samples),
-            }
-            await self.store.async_save(payload)
+            # The rounded copy is also the snapshot compared on the next save
+            payload = (
+                self._rounded_power(self.learned_power),
+                int(self.samples),
+                self.master_manual_lock_state,
+                self.master_last_state,
+            )
+            # Cleared before the write so updates made while it is in flight
+            # mark the values dirty again
+            self._lp_dirty = False
+            if payload == self._last_saved_payload:
+                return
+            # Written into the stored data in place, so the other persisted
+            # states (integration enabled, season mode, ...) are kept
+            data = self.stored_data
+            (
+                data["learned_power"],
+                data["samples"],
+                data["master_manual_lock_state"],
+                data["master_last_state"],
+            ) = payload
+            await self.store.async_save(data)
+            self._last_saved_payload = payload
             self.storage_circuit_breaker.record_success()
         except Exception as exc:
+            self._lp_dirty = True
             _LOGGER.exception("Error saving learned values: %s", exc)
             self.storage_circuit_breaker.record_failure()
             try:
-                await self._log(f"[STORAGE_ERROR] {exc}")
+                self._log(f"[STORAGE_ERROR] {exc}")
             except Exception:
                 _LOGGER.exception("Failed to write storage error to coordinator log")
 
     def _rounded_power(self, value: Any) -> Any:
-        """Recursively round power values to whole watts for clean storage."""
-        if isinstance(value, dict):
-            return {k: self._rounded_power(v) for k, v in value.items()}
-        try:
-            return int(round(float(value)))
-        except Exception:
-            return value
+        """Round learned power (zone -> {mode: watts}) to whole watts for storage."""
+        if not isinstance(value, dict):
+            return _round_watts(value)
+        return {
+            zone: (
+                {k: _round_watts(v) for k, v in entry.items()}
+                if isinstance(entry, dict)
+                else _round_watts(entry)
+            )
+            for zone, entry in value.items()
+        }
 
     # -------------------------------------------------------------------------
-    # Minimal async logging hook used by coordinator and controller
+    # Minimal logging hook used by coordinator and controller
     # -------------------------------------------------------------------------
-    async def _log(self, message: str) -> None:
-        """Async logging hook used by coordinator and controller."""
+    def _log_enabled(self) -> bool:
+        """Return True if _log output would reach the log or the logbook.
+
+        Callers check this before formatting per-cycle messages.
+        """
+        return self.activity_logging_enabled or _LOGGER.isEnabledFor(logging.INFO)
+
+    @callback
+    def _log(self, message: str, *args: Any) -> None:
+        """Logging hook used by coordinator and controller.
+
+        printf-style args are only formatted when the message is emitted.
+        """
+        if not self._log_enabled():
+            return
+        if args:
+            message = message % args
         try:
             # Keep this simple and non-blocking; expand if persistent logs are desired
             _LOGGER.info(
@@ -536,14 +984,27 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
         except Exception:
             _LOGGER.debug("Failed to write coordinator log message: %s", message)
 
-    def _validate_sensor_state(self, state: Any, sensor_name: str) -> float:
-        """Validate sensor state and return numeric value."""
-        if not state or state.state in ("unknown", "unavailable"):
+    def _validate_sensor_state(self, entity_id: str, sensor_name: str) -> float:
+        """Read a power sensor from the state cache and return its value.
+
+        On failure the entity id is kept in _failed_sensor_id, so the polling
+        back-off can wait for that sensor in particular; reading that sensor
+        successfully again ends the back-off.
+        """
+        state = self.get_tracked_state(entity_id)
+        if not state or state.state in _BAD_STATES:
+            self._failed_sensor_id = entity_id
             raise SensorUnavailableError(f"{sensor_name} unavailable")
         try:
-            return float(state.state)
+            value = float(state.state)
         except (ValueError, TypeError) as e:
+            self._failed_sensor_id = entity_id
             raise SensorInvalidError(f"{sensor_name} invalid value: {e}")
+        if entity_id == self._outage_entity:
+            # Read fine again without a state event: end the back-off
+            self._outage_entity = None
+            self.update_interval = _UPDATE_INTERVAL
+        return value
 
     def _validate_configuration(self) -> None:
         """Validate configuration on startup."""
@@ -562,46 +1023,120 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
         # Validate zone temperature sensors exist if configured
         for zone, sensor in self.zone_temp_sensors.items():
             if sensor and not self.hass.states.get(sensor):
-                _LOGGER.warning(f"Zone {zone} temperature sensor {sensor} not found")
+                _LOGGER.warning("Zone %s temperature sensor %s not found", zone, sensor)
 
     # -------------------------------------------------------------------------
     # Main update loop
     # -------------------------------------------------------------------------
 
-    async def _async_update_data(self) -> None:
-        """Main loop executed every 5 seconds."""
+    async def _async_update_data(self) -> CoordinatorSnapshot:
+        """Run one control cycle and return the state entities display."""
+        await self._async_run_cycle()
+        return self._snapshot()
+
+    def _snapshot(self) -> CoordinatorSnapshot:
+        """Build the entity-visible state for change detection."""
+        panic_manager: PanicManager | None = self.__dict__.get("panic_manager")
+        required_export = self.required_export
+        export_margin = self.export_margin
+        cache = self._state_cache
+        zone_states = tuple(
+            st.state if (st := cache.get(zone)) is not None else None
+            for zone in self._zones
+        )
+        return CoordinatorSnapshot(
+            integration_enabled=bool(self.integration_enabled),
+            season_mode=self.season_mode,
+            last_action=self.last_action,
+            note=self.note,
+            next_zone=self.next_zone,
+            last_zone=self.last_zone,
+            zone_states=zone_states,
+            master_on=self._master_on,
+            ema_30s=round(self.ema_30s, 2),
+            ema_5m=round(self.ema_5m, 2),
+            exporting=self.ema_30s < 0,
+            importing=self.ema_30s > 0,
+            confidence=round(self.confidence, 2),
+            required_export=(
+                None if required_export is None else round(required_export, 2)
+            ),
+            export_margin=(None if export_margin is None else round(export_margin, 2)),
+            samples=self.samples,
+            learned_power=tuple(
+                self.get_learned_power(self._zone_name(zone)) for zone in self._zones
+            ),
+            learning_active=bool(self.learning_active),
+            # Not built until a cycle needs it; no cooldown before then
+            panic_cooldown=panic_manager is not None and panic_manager.is_in_cooldown,
+            guard_until=self._next_guard_expiry(self._tick_now),
+        )
+
+    async def _async_run_cycle(self) -> None:
+        """Main loop, executed every 5 seconds (stretched while balanced)."""
         cycle_start = self.metrics.record_cycle_start()
+        # One monotonic clock read per cycle for every elapsed-time check
+        self._tick_now = time.monotonic()
 
+        # Every exit, early returns included, is recorded once in finally
+        success = True
         try:
             # Integration enable/disable logic
             if hasattr(self, "integration_enabled") and not self.integration_enabled:
                 self.last_action = "integration_disabled"
                 self.note = "Integration disabled by user."
+                self._balanced = False
                 _LOGGER.debug("Integration disabled, skipping all logic.")
-                self.metrics.record_cycle_end(cycle_start, success=True)
                 return
 
-            # 1. Read sensors (grid, solar, ac_power)
-            grid_raw = self._validate_sensor_state(
-                self.hass.states.get(self.config_manager.get(CONF_GRID_SENSOR)),
-                "Grid sensor",
-            )
-            solar = self._validate_sensor_state(
-                self.hass.states.get(self.config_manager.get(CONF_SOLAR_SENSOR)),
-                "Solar sensor",
-            )
-            ac_power = self._validate_sensor_state(
-                self.hass.states.get(self.config_manager.get(CONF_AC_POWER_SENSOR)),
-                "AC power sensor",
-            )
+            # Nothing invalidated the last balanced decision and no timer is
+            # due: it still holds, so not even the sensors need reading (the
+            # EMA update scales by the gap afterwards)
+            if self._balanced and not self._any_timer_due(self._tick_now):
+                _LOGGER.debug("No input changes since balanced cycle, skipping")
+                return
+            self._balanced = False
 
-            self.metrics.record_sensor_values(grid_raw, solar, ac_power)
+            # 1. Read solar first: the freeze path needs nothing else
+            solar = self._validate_sensor_state(self._solar_id, "Solar sensor")
 
             # Validate configuration on first run
             if not hasattr(self, "_config_validated"):
                 self._validate_configuration()
                 self._config_validated = True
 
+            # 2. Freeze zone management when solar is too low (regardless of master switch state)
+            # This must happen BEFORE any temperature/season reading to ensure complete freeze.
+            # Grid and AC power are not read and the EMAs are not updated; the EMA
+            # update scales by the elapsed time once the freeze ends.
+            off_threshold = self.solar_threshold_off
+            if solar <= off_threshold:
+                self.update_interval = _UPDATE_INTERVAL
+                # Master switch auto-control (based ONLY on solar production)
+                self._handle_master_switch(solar)
+                # Ensure any running tasks are cancelled and learning reset
+                await self._perform_freeze_cleanup()
+                self.last_action = "solar_too_low"
+                solar_w = round(solar)
+                self.note = f"Solar {solar_w}W <= threshold_off {off_threshold}W: freezing zone management."
+
+                # Only log freeze entry, not every cycle
+                if not self.was_in_freeze:
+                    self._log(
+                        "[FREEZE] solar=%sW <= threshold_off=%sW, "
+                        "freezing zone management",
+                        solar_w,
+                        off_threshold,
+                    )
+                    self.was_in_freeze = True
+                return
+
+            # 3. Read the remaining sensors (grid, ac_power)
+            grid_raw = self._validate_sensor_state(self._grid_id, "Grid sensor")
+            ac_power = self._validate_sensor_state(self._ac_power_id, "AC power sensor")
+
+            self.metrics.record_sensor_values(grid_raw, solar, ac_power)
+
             _LOGGER.debug(
                 "Cycle sensors: grid_raw=%s solar=%s ac_power=%s",
                 grid_raw,
@@ -610,44 +1145,34 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
             )
 
             # Enhanced logging with sensor values and calculations
-            await self._log(
-                f"[SENSORS] grid={round(grid_raw)}W solar={round(solar)}W ac_power={round(ac_power)}W "
-                f"ema30s={round(self.ema_30s)}W ema5m={round(self.ema_5m)}W"
-            )
+            if self._log_enabled():
+                self._log(
+                    "[SENSORS] grid=%dW solar=%dW ac_power=%dW ema30s=%dW ema5m=%dW",
+                    round(grid_raw),
+                    round(solar),
+                    round(ac_power),
+                    round(self.ema_30s),
+                    round(self.ema_5m),
+                )
 
             # EMA updates
             self._update_ema(grid_raw)
+            self.update_interval = _UPDATE_INTERVAL
 
-            # 2. Master switch auto-control (based ONLY on solar production)
-            await self._handle_master_switch(solar, cycle_start)
-
-            # 3. Freeze zone management when solar is too low (regardless of master switch state)
-            # This must happen BEFORE any temperature/season reading to ensure complete freeze
-            try:
-                off_threshold = self.config_manager.get_float(
-                    CONF_SOLAR_THRESHOLD_OFF, DEFAULT_SOLAR_THRESHOLD_OFF
-                )
-            except (TypeError, ValueError):
-                off_threshold = DEFAULT_SOLAR_THRESHOLD_OFF
-
-            if solar <= off_threshold:
-                # Ensure any running tasks are cancelled and learning reset
-                await self._perform_freeze_cleanup()
-                self.last_action = "solar_too_low"
-                self.note = f"Solar {round(solar)}W <= threshold_off {off_threshold}W: freezing zone management."
-
-                # Only log freeze entry, not every cycle
-                if not self.was_in_freeze:
-                    await self._log(
-                        f"[FREEZE] solar={round(solar)}W <= threshold_off={off_threshold}W, "
-                        f"freezing zone management"
-                    )
-                    self.was_in_freeze = True
-                return
+            # Master switch auto-control (based ONLY on solar production)
+            self._handle_master_switch(solar)
 
             # Reset freeze flag when exiting freeze mode
             if self.was_in_freeze:
                 self.was_in_freeze = False
+                if self._ema_reset_while_off:
+                    # Zeroed history would take minutes to converge; start
+                    # both averages from the current reading instead
+                    self._ema_reset_while_off = False
+                    self.ema_30s = self.ema_5m = grid_raw
+
+            # Season is read once per cycle; it only changes via the select entity
+            season = self.season_mode
 
             # 4. Update zone temperatures for comfort target checking
             self._read_zone_temps()
@@ -660,16 +1185,14 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
                 self.last_action = "zone_manager_uninitialized"
                 return
 
-            active_zones = await self.zone_manager.update_zone_states_and_overrides()
+            active_zones = self.zone_manager.update_zone_states_and_overrides()
             on_count = len(active_zones)
 
             # 7. Compute required export and confidences
             next_zone, last_zone = self.zone_manager.select_next_and_last_zone(
                 active_zones
             )
-            required_export = self._compute_required_export(
-                next_zone, mode=self.season_mode
-            )
+            required_export = self._compute_required_export(next_zone, mode=season)
             export = -self.ema_30s
             import_power = self.ema_5m
 
@@ -678,100 +1201,102 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
             self.last_zone = last_zone
             self.required_export = required_export
             # Track source for diagnostics: manual override vs learned power
-            try:
-                if (
-                    next_zone
-                    and isinstance(self.zone_manual_power, dict)
-                    and next_zone in self.zone_manual_power
-                ):
-                    self.required_export_source = "Manual Power Override"
-                elif self.last_action == "panic_cooldown":
-                    self.required_export_source = "Panic Recovery"
-                elif self.last_action == "integration_disabled":
-                    self.required_export_source = "Integration Disabled"
-                elif self.last_action == "solar_too_low":
-                    self.required_export_source = "Solar Freeze"
-                else:
-                    self.required_export_source = "Learned Power"
-            except Exception:
-                self.required_export_source = "Learned Power"
+            self.required_export_source = (
+                "Manual Power Override"
+                if next_zone in self.zone_manual_power
+                else _EXPORT_SOURCE_BY_ACTION.get(self.last_action, "Learned Power")
+            )
             self.export_margin = (
                 None if required_export is None else export - required_export
             )
 
             # Enhanced logging for zone selection and calculations
-            zone_info = f"active_zones={len(active_zones)}"
-            if next_zone:
-                zone_info += f" next_zone={next_zone}"
-            if last_zone:
-                zone_info += f" last_zone={last_zone}"
-            if required_export is not None:
-                zone_info += f" required_export={round(required_export)}W"
-            zone_info += f" export={round(export)}W import_power={round(import_power)}W"
+            if self._log_enabled():
+                zone_info = f"active_zones={len(active_zones)}"
+                if next_zone:
+                    zone_info += f" next_zone={next_zone}"
+                if last_zone:
+                    zone_info += f" last_zone={last_zone}"
+                if required_export is not None:
+                    zone_info += f" required_export={round(required_export)}W"
+                zone_info += (
+                    f" export={round(export)}W import_power={round(import_power)}W"
+                )
 
-            await self._log(f"[ZONE_CALC] {zone_info}")
+                self._log("[ZONE_CALC] %s", zone_info)
 
+            # Both confidence scores penalize the same short-cycle check
+            short_cycling = self.zone_manager.is_short_cycling(last_zone)
             self.last_add_conf = self.decision_engine.compute_add_conf(
                 export=export,
                 required_export=required_export,
-                last_zone=last_zone,
+                short_cycling=short_cycling,
             )
             self.last_remove_conf = self.decision_engine.compute_remove_conf(
                 import_power=import_power,
-                last_zone=last_zone,
+                short_cycling=short_cycling,
             )
 
             # Unified confidence
             self.confidence = self.last_add_conf - self.last_remove_conf
 
             # Enhanced logging for confidence calculations
-            conf_info = f"add_conf={round(self.last_add_conf, 2)} remove_conf={round(self.last_remove_conf, 2)} "
-            conf_info += f"confidence={round(self.confidence, 2)} "
-            conf_info += f"add_threshold={round(self.add_confidence_threshold, 2)} "
-            conf_info += (
-                f"remove_threshold={round(self.remove_confidence_threshold, 2)}"
-            )
-            await self._log(f"[CONFIDENCE] {conf_info}")
+            if self._log_enabled():
+                self._log(
+                    "[CONFIDENCE] add_conf=%s remove_conf=%s confidence=%s "
+                    "add_threshold=%s remove_threshold=%s",
+                    round(self.last_add_conf, 2),
+                    round(self.last_remove_conf, 2),
+                    round(self.confidence, 2),
+                    round(self.add_confidence_threshold, 2),
+                    round(self.remove_confidence_threshold, 2),
+                )
 
-            now_ts = dt_util.utcnow().timestamp()
+            now_ts = self._tick_now
 
             # 8. Learning timeout
             if self.learning_active and self.learning_start_time:
                 if now_ts - self.learning_start_time >= 360:
-                    await self._log(f"[LEARNING_TIMEOUT] zone={self.learning_zone}")
+                    self._log("[LEARNING_TIMEOUT] zone=%s", self.learning_zone)
                     await self.controller.finish_learning()
                     return
 
             # 9. Panic logic
-            if self.panic_manager.should_panic:
+            if self.panic_manager.should_panic(on_count):
                 self.note = "Panic triggered: grid import exceeded threshold with multiple zones active."
                 await self.panic_manager.schedule_panic(active_zones)
                 return
 
             # 10. Panic cooldown
-            if self.panic_manager.is_in_cooldown:
+            cooldown_remaining = self.panic_manager.cooldown_remaining(now_ts)
+            if cooldown_remaining:
                 self.last_action = "panic_cooldown"
-                # Calculate remaining cooldown time
-                now_ts = dt_util.utcnow().timestamp()
-                cooldown_remaining = max(0, 120 - (now_ts - (self.last_panic_ts or 0)))
-                self.note = f"Panic cooldown active for {round(cooldown_remaining)}s: skipping add/remove decisions."
-                await self._log(
-                    f"[PANIC_COOLDOWN] active for {round(cooldown_remaining)}s, "
-                    f"skipping add/remove decisions (active_zones={len(active_zones)})"
+                cooldown_s = round(cooldown_remaining)
+                self.note = f"Panic cooldown active for {cooldown_s}s: skipping add/remove decisions."
+                self._log(
+                    "[PANIC_COOLDOWN] active for %ss, skipping add/remove decisions "
+                    "(active_zones=%s)",
+                    cooldown_s,
+                    on_count,
                 )
                 return
 
+            # Let the last zone action settle before deciding again
+            if now_ts < self._settle_until:
+                self.note = "Waiting for the last zone action to settle."
+                return
+
             # 11. ADD zone decision
             if next_zone and self.decision_engine.should_add_zone(
                 next_zone, required_export if required_export is not None else 0.0
             ):
-                zone_name = next_zone.split(".")[-1]
-                learned_power = self.get_learned_power(zone_name, self.season_mode)
+                zone_name = self._zone_name(next_zone)
+                learned_power = self.get_learned_power(zone_name, season)
                 reason = f"Adding zone {next_zone}: confidence={round(self.confidence, 2)} >= threshold={round(self.add_confidence_threshold, 2)}, "
                 reason += f"export={round(export)}W >= required={round(required_export or 0)}W, "
                 reason += f"learned_power={round(learned_power)}W"
                 self.note = reason
-                await self._log(f"[ADD_ZONE] {reason}")
+                self._log("[ADD_ZONE] %s", reason)
                 await self.action_executor.attempt_add_zone(
                     next_zone,
                     ac_power,
@@ -784,41 +1309,142 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
             if last_zone and self.decision_engine.should_remove_zone(
                 last_zone, import_power, active_zones
             ):
-                zone_name = last_zone.split(".")[-1]
-                learned_power = self.get_learned_power(zone_name, self.season_mode)
+                zone_name = self._zone_name(last_zone)
+                learned_power = self.get_learned_power(zone_name, season)
                 reason = f"Removing zone {last_zone}: confidence={round(self.confidence, 2)} <= threshold={round(self.remove_confidence_threshold, 2)}, "
                 reason += f"import_power={round(import_power)}W > 0W, "
                 reason += f"learned_power={round(learned_power)}W, active_zones={len(active_zones)}"
                 self.note = reason
-                await self._log(f"[REMOVE_ZONE] {reason}")
+                self._log("[REMOVE_ZONE] %s", reason)
                 await self.action_executor.attempt_remove_zone(last_zone, import_power)
                 return
 
             # 12. SYSTEM BALANCED
             self.last_action = "balanced"
-            self.note = f"No action: system balanced. ema30={round(self.ema_30s)}, ema5m={round(self.ema_5m)}, zones={on_count}, samples={self.samples}"
-            await self._log(
-                f"[SYSTEM_BALANCED] ema30s={round(self.ema_30s)}W ema5m={round(self.ema_5m)}W "
-                f"active_zones={on_count} confidence={round(self.confidence, 2)} samples={self.samples}"
+            self._grid_band = self._grid_wake_band(grid_raw, required_export)
+            if self._ema_settled(grid_raw):
+                self._balanced = True
+                self._balanced_until = min(
+                    self._next_guard_expiry(now_ts),
+                    now_ts + _BALANCED_RECHECK_SECONDS,
+                )
+            self.update_interval = self._balanced_update_interval(required_export)
+            # Rebuild the note only when its content would change (or another
+            # branch replaced it since)
+            ema30_w = round(self.ema_30s)
+            ema5m_w = round(self.ema_5m)
+            note_sig = (ema30_w, ema5m_w, on_count, self.samples)
+            if (
+                note_sig != self._balanced_note_sig
+                or self.note is not self._balanced_note
+            ):
+                self._balanced_note_sig = note_sig
+                self._balanced_note = self.note = (
+                    f"No action: system balanced. ema30={ema30_w}, "
+                    f"ema5m={ema5m_w}, zones={on_count}, samples={self.samples}"
+                )
+            self._log(
+                "[SYSTEM_BALANCED] ema30s=%dW ema5m=%dW active_zones=%d "
+                "confidence=%.2f samples=%s",
+                ema30_w,
+                ema5m_w,
+                on_count,
+                self.confidence,
+                self.samples,
             )
-            self.metrics.record_cycle_end(cycle_start, success=True)
         except (SensorUnavailableError, SensorInvalidError) as e:
             # Sensor issues are expected during startup or temporary outages
             self.note = f"Sensor error: {e}"
-            _LOGGER.warning("Sensor error in update cycle: %s", e)
-            self.metrics.record_cycle_end(cycle_start, success=False)
+            failed = self._failed_sensor_id
+            if failed == self._outage_entity:
+                _LOGGER.debug("Sensor error in update cycle: %s", e)
+            else:
+                _LOGGER.warning("Sensor error in update cycle: %s", e)
+            # Poll slowly until the state listener sees that sensor recover
+            self._outage_entity = failed
+            self.update_interval = _OUTAGE_UPDATE_INTERVAL
+            success = False
         except Exception as e:
             self.note = f"Unexpected error in update cycle: {e}"
             _LOGGER.exception("Unexpected error in _async_update_data")
-            self.metrics.record_cycle_end(cycle_start, success=False)
+            success = False
+        finally:
+            self.metrics.record_cycle_end(cycle_start, success=success)
 
     # -------------------------------------------------------------------------
     # EMA / metrics / guards
     # -------------------------------------------------------------------------
     def _update_ema(self, grid_raw: float) -> None:
-        """Update EMA metrics for grid power."""
-        self.ema_30s = 0.25 * grid_raw + 0.75 * self.ema_30s
-        self.ema_5m = 0.03 * grid_raw + 0.97 * self.ema_5m
+        """Update EMA metrics for grid power.
+
+        The per-sample decay is raised to the number of nominal sample periods
+        elapsed since the previous update, so the averages stay correct when
+        cycles are delayed or skipped (restarts, sensor outages).
+        """
+        now = self._tick_now
+        last = self._last_ema_ts
+        self._last_ema_ts = now
+        if last is None or abs(now - last - _EMA_SAMPLE_SECONDS) < _EMA_JITTER_S:
+            # On-schedule tick: fixed coefficients, no pow() needed
+            e30 = self.ema_30s
+            e5 = self.ema_5m
+            self.ema_30s = e30 + _EMA_30S_ALPHA * (grid_raw - e30)
+            self.ema_5m = e5 + _EMA_5M_ALPHA * (grid_raw - e5)
+            return
+        self.ema_30s, self.ema_5m = _ema_step(
+            grid_raw, self.ema_30s, self.ema_5m, (now - last) / _EMA_SAMPLE_SECONDS
+        )
+
+    def _ema_settled(self, grid_raw: float) -> bool:
+        """Return True if both EMAs have converged on the raw grid reading."""
+        return (
+            -_SKIP_EMA_TOLERANCE_W < self.ema_30s - grid_raw < _SKIP_EMA_TOLERANCE_W
+            and -_SKIP_EMA_TOLERANCE_W < self.ema_5m - grid_raw < _SKIP_EMA_TOLERANCE_W
+        )
+
+    def _balanced_update_interval(self, required_export: float | None) -> timedelta:
+        """Return the polling interval to use after a balanced cycle.
+
+        Only stretched while the grid is exporting, so import-driven paths
+        (zone removal, panic) keep the base cadence.
+        """
+        margin = self.export_margin
+        if margin is None or required_export is None or self.ema_30s >= 0:
+            return _UPDATE_INTERVAL
+        base = _UPDATE_INTERVAL.total_seconds()
+        scale = abs(margin) / max(required_export, _MIN_MARGIN_SCALE_W)
+        seconds = int(min(_MAX_UPDATE_SECONDS, max(base, base * scale)))
+        if seconds == base:
+            return _UPDATE_INTERVAL
+        return timedelta(seconds=seconds)
+
+    @callback
+    def invalidate_balanced_decision(self) -> None:
+        """Make the next cycle evaluate in full instead of reusing a balanced one.
+
+        Call after changing anything the control decision depends on.
+        """
+        self._balanced = False
+
+    def _next_guard_expiry(self, now_ts: float) -> float:
+        """Return when the next manual lock or short-cycle window ends."""
+        expiries = [until for until in self.zone_manual_lock_until.values() if until]
+        for zone, last in self.zone_last_changed.items():
+            if not last:
+                continue
+            if self.zone_last_changed_type.get(zone) == "on":
+                expiries.append(last + self.short_cycle_on_seconds)
+            else:
+                expiries.append(last + self.short_cycle_off_seconds)
+        return min((t for t in expiries if t > now_ts), default=float("inf"))
+
+    def _any_timer_due(self, now_ts: float) -> bool:
+        """Return True if learning runs, or a guard expired or a re-check is due.
+
+        Panic cooldown needs no check here: a balanced cycle is only reached
+        once it is over.
+        """
+        return self.learning_active or now_ts >= self._balanced_until
 
     def _compute_required_export(
         self, next_zone: str | None, mode: str | None = None
@@ -836,7 +1462,7 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
         if next_zone in self.zone_manual_power:
             return self.zone_manual_power[next_zone]
 
-        zone_name = next_zone.split(".")[-1]
+        zone_name = self._zone_name(next_zone)
         lp = self.get_learned_power(zone_name, mode=mode or "default")
         return float(lp)
 
@@ -849,34 +1475,54 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
         2. Climate entity's current_temperature attribute (if zone is climate)
         3. None (temperature unavailable)
         """
-        self.zone_current_temps = {}
+        temps = self.zone_current_temps
+        get_state = self.get_tracked_state
 
-        for zone_id, temp_sensor_id in self.zone_temp_sensors.items():
+        for zone_id, temp_sensor_id in self._zone_temp_pairs:
             # Try external sensor first
-            if temp_sensor_id:
-                st = self.hass.states.get(temp_sensor_id)
-                if st and st.state not in ("unknown", "unavailable", ""):
-                    try:
-                        self.zone_current_temps[zone_id] = float(st.state)
-                        continue
-                    except (TypeError, ValueError):
-                        pass
+            if (
+                temp_sensor_id
+                and (st := get_state(temp_sensor_id))
+                and (value := st.state) not in _BAD_STATES
+            ):
+                try:
+                    temps[zone_id] = float(value)
+                    continue
+                except (TypeError, ValueError):
+                    pass
 
             # Fallback: try climate entity current_temperature attribute
-            zone_state = self.hass.states.get(zone_id)
-            if zone_state and zone_state.domain == "climate":
-                current_temp = zone_state.attributes.get("current_temperature")
-                if current_temp is not None:
-                    try:
-                        self.zone_current_temps[zone_id] = float(current_temp)
-                        continue
-                    except (TypeError, ValueError):
-                        pass
+            if (
+                (zone_state := get_state(zone_id))
+                and zone_state.domain == "climate"
+                and (current_temp := zone_state.attributes.get("current_temperature"))
+                is not None
+            ):
+                try:
+                    temps[zone_id] = float(current_temp)
+                    continue
+                except (TypeError, ValueError):
+                    pass
 
             # Temperature unavailable
-            self.zone_current_temps[zone_id] = None
+            temps[zone_id] = None
 
-    def _all_active_zones_at_target(self, zone_to_check: str | None) -> bool:
+    def _comfort_target(self) -> tuple[Callable[[float, float], bool], float] | None:
+        """Return the (comparator, threshold) pair for the current season."""
+        season = self.season_mode
+        if season == MODE_HEAT:
+            # Heat: zone must be at or above winter target
+            return operator.ge, self.max_temp_winter
+        if season == MODE_COOL:
+            # Cool: zone must be at or below summer target
+            return operator.le, self.min_temp_summer
+        return None
+
+    def _all_active_zones_at_target(
+        self,
+        zone_to_check: str | None,
+        comfort_target: tuple[Callable[[float, float], bool], float] | None = None,
+    ) -> bool:
         """
         Check if the specified zone has reached its comfort target.
 
@@ -885,6 +1531,7 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
         - In cool mode: zone <= min_temp_summer
 
         Returns False if zone has no sensor or is not at target.
+        Callers checking many zones can pass a precomputed _comfort_target().
         """
         if not zone_to_check or not self.season_mode:
             return True  # No zone specified or no season, don't block
@@ -895,25 +1542,18 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
         if current_temp is None:
             return False
 
-        if self.season_mode == "heat":
-            # Heat: zone must be at or above winter target
-            return current_temp >= self.max_temp_winter
-        elif self.season_mode == "cool":
-            # Cool: zone must be at or below summer target
-            return current_temp <= self.min_temp_summer
+        if comfort_target is None:
+            comfort_target = self._comfort_target()
+            if comfort_target is None:
+                return True  # Unknown season, don't block by default
 
-        return True  # Shouldn't reach here, but don't block by default
+        at_target, threshold = comfort_target
+        return at_target(current_temp, threshold)
 
     async def _perform_freeze_cleanup(self) -> None:
         """Cancel tasks and reset learning state when master is off."""
-        """Cancel tasks and reset learning state when master is off."""
-        # Cancel panic task
-        if self._panic_task and not self._panic_task.done():
-            try:
-                self._panic_task.cancel()
-            except Exception:
-                _LOGGER.debug("Failed to cancel panic task")
-            self._panic_task = None
+        # Cancel a pending or running panic
+        self.panic_manager.cancel()
 
         # Reset controller learning state (safe)
         try:
@@ -925,53 +1565,77 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
             )
 
         # Track master_off_since for EMA reset
-        now_ts = dt_util.utcnow().timestamp()
+        now_ts = self._tick_now
         if self.master_off_since is None:
             self.master_off_since = now_ts
 
         # Reset EMA after long OFF
         if now_ts - self.master_off_since >= _EMA_RESET_AFTER_OFF_SECONDS:
             if self.ema_30s != 0.0 or self.ema_5m != 0.0:
-                await self._log("[EMA_RESET_AFTER_MASTER_OFF] resetting EMA")
+                self._log("[EMA_RESET_AFTER_MASTER_OFF] resetting EMA")
             self.ema_30s = 0.0
             self.ema_5m = 0.0
+            self._ema_reset_while_off = True
+
+    def _service_call(
+        self, domain: str, service: str, entity_id: str
+    ) -> Callable[[], Awaitable[Any]]:
+        """Return a cached blocking call of domain.service for one entity."""
+        key = (domain, service, entity_id)
+        call = self._service_calls.get(key)
+        if call is None:
+            # HA copies service data, so the zone payload can be shared
+            data = self._zone_payloads.get(entity_id) or {"entity_id": entity_id}
+            call = self._service_calls[key] = partial(
+                self.hass.services.async_call, domain, service, data, blocking=True
+            )
+        return call
 
     async def _call_entity_service(self, entity_id: str, turn_on: bool) -> None:
         """Call turn_on/turn_off service for the entity's domain, with climate fallback."""
-        domain = entity_id.split(".")[0]
+        domain = self._entity_domain(entity_id)
         service = "turn_on" if turn_on else "turn_off"
+        season = self.season_mode
 
         # For climate entities being turned on: set HVAC mode first based on season
-        if turn_on and domain == "climate" and self.season_mode in ("heat", "cool"):
+        if turn_on and domain == "climate" and season in ("heat", "cool"):
             try:
                 await self.hass.services.async_call(
                     "climate",
                     "set_hvac_mode",
-                    {"entity_id": entity_id, "hvac_mode": self.season_mode},
+                    {"entity_id": entity_id, "hvac_mode": season},
                     blocking=True,
                 )
                 _LOGGER.debug(
                     "Set HVAC mode to '%s' for %s before turning on",
-                    self.season_mode,
+                    season,
                     entity_id,
                 )
             except Exception as e:
                 _LOGGER.warning(
                     "Failed to set HVAC mode '%s' for %s: %s — will proceed with turn_on",
-                    self.season_mode,
+                    season,
                     entity_id,
                     e,
                 )
 
+        if entity_id in self._fallback_entities:
+            try:
+                await self._service_call("climate", service, entity_id)()
+            except Exception:
+                _LOGGER.exception("climate.%s failed for %s", service, entity_id)
+            return
+
+        # Any failure is logged rather than raised, so a misbehaving service
+        # handler cannot abort the caller (a panic shed runs zones together)
         try:
-            await self.hass.services.async_call(
-                domain,
-                service,
-                {"entity_id": entity_id},
-                blocking=True,
-            )
+            await self._service_call(domain, service, entity_id)()
             return
         except Exception as e:
+            if domain == "climate":
+                # The fallback would repeat the same call
+                _LOGGER.error("climate.%s failed for %s: %s", service, entity_id, e)
+                return
             _LOGGER.debug(
                 "Primary service %s.%s failed for %s: %s",
                 domain,
@@ -981,12 +1645,9 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
             )
 
         try:
-            await self.hass.services.async_call(
-                "climate",
-                service,
-                {"entity_id": entity_id},
-                blocking=True,
-            )
+            await self._service_call("climate", service, entity_id)()
+            # Skip the failing primary service for this entity from now on
+            self._fallback_entities.add(entity_id)
             _LOGGER.warning(
                 "Primary service %s.%s failed for %s — used climate.%s as fallback",
                 domain,
@@ -1003,104 +1664,87 @@ class SolarACCoordinator(DataUpdateCoordinator[SensorStates]):
     # -------------------------------------------------------------------------
     # Master switch control
     # -------------------------------------------------------------------------
-    async def _handle_master_switch(self, solar: float, cycle_start) -> None:
-        """Master relay control with sticky manual lock until natural solar cycle aligns."""
-        ac_switch = self.config_manager.get(CONF_AC_SWITCH)
-        if not ac_switch:
+    @callback
+    def _async_master_call_done(self, task: asyncio.Task) -> None:
+        """Allow a retry if the master switch service call could not be made."""
+        if task.cancelled() or (err := task.exception()) is None:
             return
+        self._desired_master = None
+        # Drop the optimistic flags: the switch is still where it was
+        self._set_master_flags(self._state_cache.get(self._ac_switch_id))
+        _LOGGER.warning("Master switch service call failed: %s", err)
 
-        try:
-            on_threshold = self.config_manager.get_float(
-                CONF_SOLAR_THRESHOLD_ON, DEFAULT_SOLAR_THRESHOLD_ON
-            )
-        except (TypeError, ValueError):
-            on_threshold = DEFAULT_SOLAR_THRESHOLD_ON
-
-        try:
-            off_threshold = self.config_manager.get_float(
-                CONF_SOLAR_THRESHOLD_OFF, DEFAULT_SOLAR_THRESHOLD_OFF
-            )
-        except (TypeError, ValueError):
-            off_threshold = DEFAULT_SOLAR_THRESHOLD_OFF
-
-        switch_state_obj = self.hass.states.get(ac_switch)
-        if not switch_state_obj:
+    @callback
+    def _handle_master_switch(self, solar: float) -> None:
+        """Master relay control with sticky manual lock until natural solar cycle aligns."""
+        if not self._ac_switch_id:
             return
 
-        switch_state = switch_state_obj.state
-
-        # Detect manual changes (state changed without recent coordinator action)
+        # A request no state change confirmed in time is given up, falling
+        # back to the last reported state
         if (
-            self.master_last_state is not None
-            and switch_state != self.master_last_state
+            self._desired_master is not None
+            and self._tick_now >= self._desired_master_until
         ):
-            now = dt_util.utcnow().timestamp()
-            # If no recent coordinator action (within 10s), it's a manual change
-            if (
-                self.master_last_action_time is None
-                or (now - self.master_last_action_time) > 10
-            ):
-                self.master_manual_lock_state = switch_state
-                await self._log(
-                    f"[MASTER_MANUAL_LOCK] detected manual change to {switch_state}, locking until natural cycle aligns"
-                )
+            self._desired_master = None
+            self._set_master_flags(self._state_cache.get(self._ac_switch_id))
+
+        # Pick the side of the hysteresis band solar is on. Inside the band
+        # nothing can switch or release a lock; manual changes are detected by
+        # the state listener as they happen.
+        if solar >= self.solar_threshold_on:
+            turn_on, threshold = True, self.solar_threshold_on
+        elif solar <= self.solar_threshold_off:
+            turn_on, threshold = False, self.solar_threshold_off
+        else:
+            return
 
-        # Check if lock should be released
-        if self.master_manual_lock_state is not None:
-            # Release lock if locked ON and solar would naturally turn it ON
-            if self.master_manual_lock_state == "on" and solar >= on_threshold:
-                await self._log(
-                    f"[MASTER_LOCK_RELEASE] solar={round(solar)} >= threshold_on={on_threshold}, resuming auto-control"
-                )
-                self.master_manual_lock_state = None
-            # Release lock if locked OFF and solar would naturally turn it OFF
-            elif self.master_manual_lock_state == "off" and solar <= off_threshold:
-                await self._log(
-                    f"[MASTER_LOCK_RELEASE] solar={round(solar)} <= threshold_off={off_threshold}, resuming auto-control"
-                )
-                self.master_manual_lock_state = None
-            else:
-                # Still locked, skip auto-control
-                self.master_last_state = switch_state
+        # A manual lock holds until solar would naturally switch the same way.
+        # That can only change when solar reaches the other side of the band
+        # or a new lock is taken, so it is re-checked only then.
+        lock = self.master_manual_lock_state
+        if lock is not None:
+            if turn_on is self._lock_checked_side:
+                return
+            self._lock_checked_side = turn_on
+            if lock != (STATE_ON if turn_on else STATE_OFF):
                 return
 
-        # Update last known state
-        self.master_last_state = switch_state
+        service, state, action, log_fmt, release_fmt = _MASTER_ACTIONS[turn_on]
+        solar_w = round(solar)
+        if lock is not None:
+            self._log(release_fmt, solar_w, threshold)
+            self.master_manual_lock_state = None
+            self._schedule_master_save()
 
-        # Normal auto-control (only when not locked)
-        # Turn ON when solar is above or equal to ON threshold
-        if solar >= on_threshold and switch_state == "off":
-            await self._log(
-                f"[MASTER_ON] solar={round(solar)}W >= threshold_on={on_threshold}W, "
-                f"turning AC master switch ON"
-            )
-            await self.hass.services.async_call(
-                "switch",
-                "turn_on",
-                {"entity_id": ac_switch},
-                blocking=True,
-            )
-            self.last_action = "master_on"
-            self.master_last_action_time = dt_util.utcnow().timestamp()
-            # reset master_off_since when turned on
-            self.master_off_since = None
+        # Already on the solar side's state (or state unknown), or the same
+        # request is still propagating: nothing to do
+        if (
+            not (self._master_off if turn_on else self._master_on)
+            or self._desired_master == state
+        ):
             return
 
-        # Turn OFF when solar is below or equal to OFF threshold
-        if solar <= off_threshold and switch_state == "on":
-            await self._log(
-                f"[MASTER_OFF_TRIGGER] solar={round(solar)}W <= threshold_off={off_threshold}W, "
-                f"turning AC master switch OFF"
-            )
-            await self.hass.services.async_call(
+        self._log(log_fmt, solar_w, threshold)
+        context = Context()
+        self._own_contexts.append(context.id)
+        self._desired_master = state
+        self._desired_master_until = self._tick_now + _MASTER_CONFIRM_TIMEOUT_S
+        # Not awaited: the state listener confirms the switch, and a failed
+        # dispatch is reported by _async_master_call_done
+        self.hass.async_create_task(
+            self.hass.services.async_call(
                 "switch",
-                "turn_off",
-                {"entity_id": ac_switch},
-                blocking=True,
-            )
-            self.last_action = "master_off"
-            self.master_last_action_time = dt_util.utcnow().timestamp()
-            # mark master_off_since for EMA reset logic
-            self.master_off_since = dt_util.utcnow().timestamp()
-            self.metrics.record_cycle_end(cycle_start, success=True)
-            return
+                service,
+                self._master_payload,
+                blocking=False,
+                context=context,
+            ),
+            name="solar_ac_master_switch",
+            eager_start=True,
+        ).add_done_callback(self._async_master_call_done)
+        # Optimistic until the state listener reports the real state
+        self._master_on, self._master_off = turn_on, not turn_on
+        self.last_action = action
+        # master_off_since drives the EMA reset after a long OFF
+        self.master_off_since = None if turn_on else self._tick_now
@@ -22,9 +22,13 @@ class DecisionEngine:
         self,
         export: float,
         required_export: float | None,
-        last_zone: str | None,
+        short_cycling: bool,
     ) -> float:
-        """Compute add zone confidence score."""
+        """Compute add zone confidence score.
+
+        short_cycling tells whether the last active zone is still inside its
+        short-cycle window.
+        """
         if required_export is None:
             return 0.0
 
@@ -37,16 +41,22 @@ class DecisionEngine:
 
         export_margin = export_val - required_export_val
 
-        base = min(40, max(0, export_margin / 25))
-        sample_bonus = min(20, self.coordinator.samples * 2)
-        short_cycle_penalty = -30 if self._is_short_cycling_for_add(last_zone) else 0
-
-        return base + 5 + sample_bonus + short_cycle_penalty
+        # Clamps as plain comparisons: cheaper than min()/max() calls
+        base = export_margin / 25
+        if base < 0:
+            base = 0.0
+        elif base > 40:
+            base = 40.0
+        samples = self.coordinator.samples
+        conf = base + 5 + (samples * 2 if samples < 10 else 20)
+        if short_cycling:
+            conf -= 30
+        return conf
 
     def compute_remove_conf(
         self,
         import_power: float,
-        last_zone: str | None,
+        short_cycling: bool,
     ) -> float:
         """Compute remove zone confidence score.
 
@@ -55,11 +65,17 @@ class DecisionEngine:
         if import_power >= self.coordinator.panic_threshold:
             return 100.0
 
-        base = min(60, max(0, (import_power - 200) / 8))
-        heavy_import_bonus = 20 if import_power > 1500 else 0
-        short_cycle_penalty = -40 if self._is_short_cycling_for_remove(last_zone) else 0
-
-        return base + 5 + heavy_import_bonus + short_cycle_penalty
+        base = (import_power - 200) / 8
+        if base < 0:
+            base = 0.0
+        elif base > 60:
+            base = 60.0
+        conf = base + 5
+        if import_power > 1500:
+            conf += 20
+        if short_cycling:
+            conf -= 40
+        return conf
 
     def should_add_zone(self, next_zone: str, required_export: float | None) -> bool:
         """Return True if add zone conditions are met."""
@@ -99,34 +115,3 @@ class DecisionEngine:
             return False
 
         return True
-
-    def _is_short_cycling_for_add(self, zone: str | None) -> bool:
-        """Check if zone is short-cycling (for add penalty).
-
-        Uses time.monotonic() for interval measurement if both now and last are monotonic values.
-        If last is a wall-clock timestamp (from dt_util), uses dt_util.utcnow().timestamp().
-        """
-
-        if not zone:
-            return False
-        last = self.coordinator.zone_last_changed.get(zone)
-        if not last:
-            return False
-        # If last is monotonic, use monotonic; else fallback to wall time
-        # (Assume all zone_last_changed are wall time for HA compatibility)
-        from homeassistant.util import dt as dt_util
-
-        now = dt_util.utcnow().timestamp()
-        last_type = self.coordinator.zone_last_changed_type.get(zone)
-        if last_type == "on":
-            threshold = self.coordinator.short_cycle_on_seconds
-        elif last_type == "off":
-            threshold = self.coordinator.short_cycle_off_seconds
-        else:
-            threshold = self.coordinator.short_cycle_off_seconds
-
-        return (now - last) < threshold
-
-    def _is_short_cycling_for_remove(self, zone: str | None) -> bool:
-        """Check if zone is short-cycling (for remove penalty)."""
-        return self._is_short_cycling_for_add(zone)
@@ -8,6 +8,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from .const import CONF_GRID_SENSOR, CONF_SOLAR_SENSOR, DOMAIN, SolarACData
+from .helpers import _monotonic_to_epoch
 
 # Keys to redact for privacy (e.g., if you had API keys)
 TO_REDACT = {CONF_SOLAR_SENSOR, CONF_GRID_SENSOR}
@@ -50,9 +51,11 @@ async def async_get_config_entry_diagnostics(
         "note": getattr(coordinator, "note", None),
         "required_export_source": getattr(coordinator, "required_export_source", None),
         "last_action_started_at": iso_ts(
-            getattr(coordinator, "last_action_start_ts", None)
+            _monotonic_to_epoch(getattr(coordinator, "last_action_start_ts", None))
+        ),
+        "last_panic_at": iso_ts(
+            _monotonic_to_epoch(getattr(coordinator, "last_panic_ts", None))
         ),
-        "last_panic_at": iso_ts(getattr(coordinator, "last_panic_ts", None)),
     }
 
     # 3. Learning Data (The most important part for troubleshooting)
@@ -73,8 +76,8 @@ async def async_get_config_entry_diagnostics(
         zone_info[zone] = {
             "friendly_name": friendly,
             "last_state": getattr(coordinator, "zone_last_state", {}).get(zone),
-            "locked_until": getattr(coordinator, "zone_manual_lock_until", {}).get(
-                zone
+            "locked_until": _monotonic_to_epoch(
+                getattr(coordinator, "zone_manual_lock_until", {}).get(zone)
             ),
             "is_locked": (
                 getattr(coordinator, "zone_manager").is_locked(zone)
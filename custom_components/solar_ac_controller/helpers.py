@@ -1,10 +1,13 @@
 # custom_components/solar_ac_controller/helpers.py
 from __future__ import annotations
 
+import time
 from typing import Any, Dict, List
 
 from homeassistant.util import dt as dt_util
 
+from .const import MODE_COOL, MODE_DEFAULT, MODE_HEAT
+
 
 def _safe_float(val: Any, default: float | None = None) -> float | None:
     """Safely convert a value to float, or return default if conversion fails."""
@@ -14,12 +17,60 @@ def _safe_float(val: Any, default: float | None = None) -> float | None:
         return default
 
 
-def _human_delta(ts: float | None) -> str | None:
-    """Return a human-readable time delta string for a timestamp."""
+# Value types accepted as stored watts without conversion checks
+_WATT_TYPES = frozenset((int, float))
+
+
+def _normalize_learned_entry(val: Any, initial: float) -> dict[str, float]:
+    """Normalize one stored learned_power entry to {default, heat, cool} floats.
+
+    Used both when migrating the stored payload and when the coordinator
+    loads it. Modes missing from a dict entry start at the initial value.
+    """
+    if type(val) is float:
+        return {MODE_DEFAULT: val, MODE_HEAT: val, MODE_COOL: val}
+    if isinstance(val, (int, float)):
+        v = float(val)
+        return {MODE_DEFAULT: v, MODE_HEAT: v, MODE_COOL: v}
+    if not isinstance(val, dict):
+        return {MODE_DEFAULT: initial, MODE_HEAT: initial, MODE_COOL: initial}
+
+    # Fast path for the shape saved by this version: exactly the three modes
+    if len(val) == 3:
+        default = val.get(MODE_DEFAULT)
+        heat = val.get(MODE_HEAT)
+        cool = val.get(MODE_COOL)
+        if (
+            type(default) in _WATT_TYPES
+            and type(heat) in _WATT_TYPES
+            and type(cool) in _WATT_TYPES
+        ):
+            return {
+                MODE_DEFAULT: float(default),
+                MODE_HEAT: float(heat),
+                MODE_COOL: float(cool),
+            }
+
+    normalized = {MODE_DEFAULT: initial, MODE_HEAT: initial, MODE_COOL: initial}
+    for k, vv in val.items():
+        try:
+            normalized[k.lower()] = float(vv)
+        except Exception:
+            continue
+    return normalized
+
+
+def _human_delta(ts: float | None, now: float | None = None) -> str | None:
+    """Return a human-readable time delta string for a timestamp.
+
+    ts is a wall-clock epoch unless now is given from the same clock
+    (e.g. time.monotonic()).
+    """
     if not ts:
         return None
     try:
-        now = dt_util.utcnow().timestamp()
+        if now is None:
+            now = dt_util.utcnow().timestamp()
         diff = int(now - float(ts))
         if diff < 0:
             return "in the future"
@@ -39,6 +90,13 @@ def _human_delta(ts: float | None) -> str | None:
         return None
 
 
+def _monotonic_to_epoch(ts: float | None) -> float | None:
+    """Convert a time.monotonic() reading to a wall-clock epoch timestamp."""
+    if ts is None:
+        return None
+    return dt_util.utcnow().timestamp() - (time.monotonic() - ts)
+
+
 def _iso_ts(ts: float | None) -> str | None:
     """Return ISO8601 UTC string for a timestamp (seconds precision)."""
     if ts is None:
@@ -76,7 +134,7 @@ def build_diagnostics(coordinator: Any) -> Dict[str, Any]:
     learning_active = bool(getattr(coordinator, "learning_active", False))
     learning_zone = getattr(coordinator, "learning_zone", None)
     learning_start_time_ts = getattr(coordinator, "learning_start_time", None)
-    learning_started = _human_delta(learning_start_time_ts)
+    learning_started = _human_delta(learning_start_time_ts, time.monotonic())
     ac_power_before = _safe_float(getattr(coordinator, "ac_power_before", None), None)
     ac_power_after = _safe_float(getattr(coordinator, "ac_power_after", None), None)
 
@@ -106,11 +164,16 @@ def build_diagnostics(coordinator: Any) -> Dict[str, Any]:
     zones_config: List[str] = list(config.get("zones", []) or [])
     active_zones: List[str] = []
     zone_modes: Dict[str, str] = {}
-    zone_last_changed = dict(getattr(coordinator, "zone_last_changed", {}) or {})
+    # Zone guard timestamps are monotonic; report them as epoch seconds
+    zone_last_changed = {
+        z: _monotonic_to_epoch(ts)
+        for z, ts in (getattr(coordinator, "zone_last_changed", {}) or {}).items()
+    }
     zone_last_state = dict(getattr(coordinator, "zone_last_state", {}) or {})
-    zone_manual_lock_until = dict(
-        getattr(coordinator, "zone_manual_lock_until", {}) or {}
-    )
+    zone_manual_lock_until = {
+        z: _monotonic_to_epoch(ts)
+        for z, ts in (getattr(coordinator, "zone_manual_lock_until", {}) or {}).items()
+    }
 
     # Master switch manual lock state
     master_last_state = getattr(coordinator, "master_last_state", None)
@@ -157,18 +220,18 @@ def build_diagnostics(coordinator: Any) -> Dict[str, Any]:
     panic_threshold = _safe_float(getattr(coordinator, "panic_threshold", None), None)
     panic_delay = int(getattr(coordinator, "panic_delay", 0) or 0)
     last_panic_ts = getattr(coordinator, "last_panic_ts", None)
-    last_panic = _human_delta(last_panic_ts)
+    last_panic = _human_delta(last_panic_ts, time.monotonic())
     panic_cooldown_active = (
         getattr(coordinator, "panic_manager", None)
         and coordinator.panic_manager.is_in_cooldown
     )
 
     master_off_since_raw = getattr(coordinator, "master_off_since", None)
-    master_off = _human_delta(master_off_since_raw)
+    master_off = _human_delta(master_off_since_raw, time.monotonic())
 
     # Last action timestamps/durations if available
     last_action_start_ts = getattr(coordinator, "last_action_start_ts", None)
-    last_action_started = _human_delta(last_action_start_ts)
+    last_action_started = _human_delta(last_action_start_ts, time.monotonic())
     last_action_duration = None
     try:
         dur = getattr(coordinator, "last_action_duration", None)
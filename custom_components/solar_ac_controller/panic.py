@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from datetime import datetime
+from functools import partial
 from typing import TYPE_CHECKING
 
-from homeassistant.util import dt as dt_util
-
-from .const import CONF_AC_SWITCH
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later
 
 if TYPE_CHECKING:
     from .coordinator import SolarACCoordinator
@@ -23,71 +25,131 @@ class PanicManager:
 
     def __init__(self, coordinator: "SolarACCoordinator") -> None:
         self.coordinator = coordinator
+        self._cooldown_for_ts: float | None = None
+        self._cooldown_until: float | None = None
+        # Pending panic delay timer (a TimerHandle, not a sleeping task)
+        self._cancel_delay: CALLBACK_TYPE | None = None
 
     @property
     def is_panicking(self) -> bool:
-        """Return True if a panic task is currently running (zones are being shed)."""
-        return (
+        """Return True if a panic is pending its delay or shedding zones."""
+        return self._cancel_delay is not None or (
             self.coordinator._panic_task is not None
             and not self.coordinator._panic_task.done()
         )
 
-    @property
-    def should_panic(self) -> bool:
-        """Return True if panic shedding should be triggered."""
-        # Use on_count from coordinator if available, else default to 2
-        on_count = getattr(self.coordinator, "on_count", 2)
+    @callback
+    def cancel(self) -> None:
+        """Cancel a pending or running panic."""
+        if self._cancel_delay is not None:
+            self._cancel_delay()
+            self._cancel_delay = None
+        task = self.coordinator._panic_task
+        if task is not None and not task.done():
+            task.cancel()
+        self.coordinator._panic_task = None
+
+    def should_panic(self, on_count: int) -> bool:
+        """Return True if panic shedding should be triggered.
+
+        Only with more than one zone running; a single zone is left to the
+        regular removal path. The zone count is checked first as it is false
+        far more often than the import test.
+        """
         return (
-            self.coordinator.ema_30s > self.coordinator.panic_threshold and on_count > 1
+            on_count > 1 and self.coordinator.ema_30s > self.coordinator.panic_threshold
         )
 
     @property
     def is_in_cooldown(self) -> bool:
         """Return True if in panic cooldown period."""
-        now_ts = dt_util.utcnow().timestamp()
         if self.coordinator.last_panic_ts is None:
             return False
-        return (now_ts - self.coordinator.last_panic_ts) < _PANIC_COOLDOWN_SECONDS
+        return self.cooldown_remaining(time.monotonic()) > 0
+
+    def cooldown_remaining(self, now_ts: float) -> float:
+        """Return seconds left in the panic cooldown at now_ts (0 when over).
+
+        The cooldown end is only recomputed when a new panic is recorded, and
+        once it has passed no further arithmetic is done until the next panic.
+        """
+        last = self.coordinator.last_panic_ts
+        if last is None:
+            return 0.0
+        if last != self._cooldown_for_ts:
+            self._cooldown_for_ts = last
+            self._cooldown_until = last + _PANIC_COOLDOWN_SECONDS
+        if self._cooldown_until is None:
+            return 0.0
+        remaining = self._cooldown_until - now_ts
+        if remaining <= 0:
+            self._cooldown_until = None
+            return 0.0
+        return remaining
 
     async def schedule_panic(self, active_zones: list[str]) -> None:
         """Schedule panic task if not already running."""
         if self.coordinator.last_action != "panic":
-            await self.coordinator._log(
+            self.coordinator._log(
                 f"[PANIC_SHED_TRIGGER] ema30={round(self.coordinator.ema_30s)} "
                 f"ema5m={round(self.coordinator.ema_5m)} "
                 f"threshold={self.coordinator.panic_threshold} "
                 f"zones={active_zones}"
             )
-            if not self.coordinator._panic_task or self.coordinator._panic_task.done():
-                self.coordinator._panic_task = self.coordinator.hass.async_create_task(
-                    self._panic_task_runner(active_zones)
+            if self.is_panicking:
+                return
+            if self.coordinator.panic_delay > 0:
+                self._cancel_delay = async_call_later(
+                    self.coordinator.hass,
+                    self.coordinator.panic_delay,
+                    partial(self._async_delay_done, active_zones),
                 )
+            else:
+                self._start_panic_task(active_zones)
+
+    @callback
+    def _async_delay_done(self, active_zones: list[str], _now: datetime) -> None:
+        """Start shedding once the panic delay has passed."""
+        self._cancel_delay = None
+        self._start_panic_task(active_zones)
+
+    @callback
+    def _start_panic_task(self, active_zones: list[str]) -> None:
+        """Run the panic shed in its own task."""
+        self.coordinator._panic_task = self.coordinator.hass.async_create_task(
+            self._panic_task_runner(active_zones),
+            name="solar_ac_panic",
+            eager_start=True,
+        )
 
     async def _panic_shed(self, active_zones: list[str]) -> None:
-        """Shed all but the first active zone during panic."""
-        start = dt_util.utcnow().timestamp()
-        for zone in active_zones[1:]:
-            await self.coordinator._call_entity_service(zone, False)
+        """Shed all but the first active zone during panic.
+
+        Turn-off calls are issued concurrently; each call keeps its own climate
+        fallback, so one failing zone does not hold up the others.
+        """
+        start = time.monotonic()
+        zones_to_shed = active_zones[1:]
+        if zones_to_shed:
+            await asyncio.gather(
+                *(
+                    self.coordinator._call_entity_service(zone, False)
+                    for zone in zones_to_shed
+                )
+            )
             await asyncio.sleep(self.coordinator.action_delay_seconds)
-        end = dt_util.utcnow().timestamp()
         self.coordinator.last_action_start_ts = start
-        self.coordinator.last_action_duration = end - start
+        self.coordinator.last_action_duration = time.monotonic() - start
 
     async def _panic_task_runner(self, active_zones: list[str]) -> None:
-        """Run panic task with delay and learning reset."""
+        """Run the panic shed and learning reset after the delay."""
         try:
-            if self.coordinator.panic_delay > 0:
-                await asyncio.sleep(self.coordinator.panic_delay)
-
             # If master turned off during delay, abort
-            ac_switch = self.coordinator.config.get(CONF_AC_SWITCH)
-            if ac_switch:
-                st = self.coordinator.hass.states.get(ac_switch)
-                if st and st.state == "off":
-                    await self.coordinator._log(
-                        "[PANIC_ABORTED] master switch turned off during panic delay"
-                    )
-                    return
+            if self.coordinator._master_off:
+                self.coordinator._log(
+                    "[PANIC_ABORTED] master switch turned off during panic delay"
+                )
+                return
 
             if self.coordinator.ema_30s > self.coordinator.panic_threshold:
                 await self._panic_shed(active_zones)
@@ -101,10 +163,9 @@ class PanicManager:
                         "Controller reset learning method failed or controller not set"
                     )
 
-                now_ts = dt_util.utcnow().timestamp()
-                self.coordinator.last_panic_ts = now_ts
+                self.coordinator.last_panic_ts = time.monotonic()
 
-                await self.coordinator._log(
+                self.coordinator._log(
                     f"[PANIC_SHED] ema30={round(self.coordinator.ema_30s)} "
                     f"ema5m={round(self.coordinator.ema_5m)} zones={active_zones}"
                 )
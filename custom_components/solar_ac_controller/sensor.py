@@ -14,6 +14,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import CONF_ENABLE_DIAGNOSTICS_SENSOR, CONF_ZONES, DOMAIN, SolarACData
 from .helpers import build_diagnostics
+from .zones import _ACTIVE_STATES
 
 
 async def async_setup_entry(
@@ -101,9 +102,9 @@ class SolarACActiveZonesSensor(_BaseSolarACSensor):
     def native_value(self) -> str:
         zones = [
             z
-            for z in self.coordinator.config.get(CONF_ZONES, [])
-            if (st := self.coordinator.hass.states.get(z))
-            and st.state in ("heat", "cool", "on")
+            for z in self.coordinator._zones
+            if (st := self.coordinator.get_tracked_state(z))
+            and st.state in _ACTIVE_STATES
         ]
         return ", ".join(zones) if zones else "none"
 
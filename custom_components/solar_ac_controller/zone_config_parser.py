@@ -1,11 +1,26 @@
 # custom_components/solar_ac_controller/zone_config_parser.py
 """Zone configuration parsing utilities."""
 
-from typing import Dict, List
+from typing import Any, Dict, List
 
 from homeassistant.config_entries import ConfigEntry
 
 
+def _option(config_entry: ConfigEntry, key: str, default: Any) -> Any:
+    """Return an entry option, falling back to the entry data."""
+    options = config_entry.options
+    if key in options:
+        return options[key]
+    return config_entry.data.get(key, default)
+
+
+def _is_number(item: Any) -> bool:
+    """Return True for numbers and plain numeric strings like "1500.5"."""
+    if isinstance(item, (int, float)):
+        return True
+    return isinstance(item, str) and item.replace(".", "", 1).isdigit()
+
+
 class ZoneConfigParser:
     """Parses zone-related configuration from config entries."""
 
@@ -14,70 +29,37 @@ class ZoneConfigParser:
         config_entry: ConfigEntry, zones: List[str]
     ) -> Dict[str, str]:
         """Parse zone temperature sensor mappings."""
-        zone_temp_sensors_list = (
-            config_entry.options.get(
-                "zone_temp_sensors", config_entry.data.get("zone_temp_sensors", [])
-            )
-            or []
-        )
-
-        zone_temp_sensors = {}
-        for idx, zone_id in enumerate(zones):
-            if idx < len(zone_temp_sensors_list) and zone_temp_sensors_list[idx]:
-                zone_temp_sensors[zone_id] = zone_temp_sensors_list[idx]
-
-        return zone_temp_sensors
+        sensors = _option(config_entry, "zone_temp_sensors", []) or []
+        return {zone_id: sensor for zone_id, sensor in zip(zones, sensors) if sensor}
 
     @staticmethod
     def parse_manual_power(
         config_entry: ConfigEntry, zones: List[str]
     ) -> Dict[str, float]:
-        """Parse zone manual power mappings."""
-        raw_manual = config_entry.options.get(
-            "zone_manual_power", config_entry.data.get("zone_manual_power", [])
-        )
-
-        zone_manual_power = {}
+        """Parse zone manual power mappings.
 
+        Accepts a comma-separated string or a list, either of plain numbers
+        (mapped to zones by index) or of legacy "zone_id:power" items.
+        """
+        raw_manual = _option(config_entry, "zone_manual_power", [])
         if isinstance(raw_manual, str):
-            parts = [p.strip() for p in raw_manual.split(",") if p.strip()]
-            # If all parts are numbers, map by index to zones
-            if all(part.replace(".", "", 1).isdigit() for part in parts):
-                for idx, val in enumerate(parts):
-                    if idx < len(zones):
-                        try:
-                            zone_manual_power[zones[idx]] = float(val)
-                        except Exception:
-                            continue
-            else:
-                # Legacy: zone_id:power
-                for part in parts:
-                    if ":" in part:
-                        zone, val = part.split(":", 1)
-                        try:
-                            zone_manual_power[zone.strip()] = float(val)
-                        except Exception:
-                            continue
+            items: List[Any] = [p.strip() for p in raw_manual.split(",") if p.strip()]
         elif isinstance(raw_manual, (list, tuple)):
-            # If all items are numbers, map by index
-            if all(
-                isinstance(item, (int, float))
-                or (isinstance(item, str) and item.replace(".", "", 1).isdigit())
-                for item in raw_manual
-            ):
-                for idx, val in enumerate(raw_manual):
-                    if idx < len(zones):
-                        try:
-                            zone_manual_power[zones[idx]] = float(val)
-                        except Exception:
-                            continue
-            else:
-                for item in list(raw_manual):
-                    if isinstance(item, str) and ":" in item:
-                        zone, val = item.split(":", 1)
-                        try:
-                            zone_manual_power[zone.strip()] = float(val)
-                        except Exception:
-                            continue
+            items = list(raw_manual)
+        else:
+            return {}
+
+        zone_manual_power: Dict[str, float] = {}
+        if all(_is_number(item) for item in items):
+            for zone_id, val in zip(zones, items):
+                zone_manual_power[zone_id] = float(val)
+            return zone_manual_power
 
+        for item in items:
+            if isinstance(item, str) and ":" in item:
+                zone, val = item.split(":", 1)
+                try:
+                    zone_manual_power[zone.strip()] = float(val)
+                except ValueError:
+                    continue
         return zone_manual_power
@@ -5,15 +5,16 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-from homeassistant.util import dt as dt_util
-
-from .const import CONF_ZONES
+from homeassistant.core import callback
 
 if TYPE_CHECKING:
     from .coordinator import SolarACCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Zone states that count as running: heating, cooling and generic "on"
+_ACTIVE_STATES = frozenset(("heat", "cool", "on"))
+
 
 class ZoneManager:
     """Manages zone state tracking, overrides, locks, and short-cycle protection."""
@@ -22,12 +23,19 @@ class ZoneManager:
         """Initialize zone manager."""
         self.coordinator = coordinator
 
-    async def update_zone_states_and_overrides(self) -> list[str]:
+    @callback
+    def update_zone_states_and_overrides(self) -> list[str]:
         """Update zone states, detect manual overrides, and return active zones."""
+        coordinator = self.coordinator
         active_zones: list[str] = []
-
-        for zone in self.coordinator.config.get(CONF_ZONES, []):
-            state_obj = self.coordinator.hass.states.get(zone)
+        get_state = coordinator.get_tracked_state
+        zone_last_state = coordinator.zone_last_state
+        # A state change is ours if the last action named the zone or shed all
+        last_action = coordinator.last_action or ""
+        all_ours = last_action == "panic"
+
+        for zone in coordinator._zones:
+            state_obj = get_state(zone)
             if not state_obj:
                 _LOGGER.warning(
                     f"Configured zone entity '{zone}' is missing in Home Assistant. Check for typos or missing entities."
@@ -35,30 +43,26 @@ class ZoneManager:
                 continue
 
             state = state_obj.state
-            last_state = self.coordinator.zone_last_state.get(zone)
+            last_state = zone_last_state.get(zone)
 
             # Manual override detection
-            if last_state is not None and last_state != state:
-                if not (
-                    self.coordinator.last_action
-                    and (
-                        self.coordinator.last_action.endswith(zone)
-                        or self.coordinator.last_action == "panic"
-                    )
-                ):
-                    now_ts = dt_util.utcnow().timestamp()
-                    self.coordinator.zone_manual_lock_until[zone] = (
-                        now_ts + self.coordinator.manual_lock_seconds
-                    )
-                    await self.coordinator._log(
-                        f"[MANUAL_OVERRIDE] zone={zone} state={state} "
-                        f"lock_until={int(self.coordinator.zone_manual_lock_until[zone])}"
-                    )
-
-            self.coordinator.zone_last_state[zone] = state
+            if (
+                last_state is not None
+                and last_state != state
+                and not (all_ours or (last_action and last_action.endswith(zone)))
+            ):
+                lock_s = coordinator.manual_lock_seconds
+                coordinator.zone_manual_lock_until[zone] = (
+                    coordinator._tick_now + lock_s
+                )
+                coordinator._log(
+                    "[MANUAL_OVERRIDE] zone=%s state=%s lock_s=%s", zone, state, lock_s
+                )
+
+            zone_last_state[zone] = state
 
             # Treat heating, cooling and generic "on" as active
-            if state in ("heat", "cool", "on"):
+            if state in _ACTIVE_STATES:
                 active_zones.append(zone)
 
         return active_zones
@@ -66,7 +70,7 @@ class ZoneManager:
     def is_locked(self, zone_id: str) -> bool:
         """Return True if a zone is locked due to manual override."""
         until = self.coordinator.zone_manual_lock_until.get(zone_id)
-        return bool(until and dt_util.utcnow().timestamp() < until)
+        return bool(until and self.coordinator._tick_now < until)
 
     def select_next_and_last_zone(
         self, active_zones: list[str]
@@ -80,13 +84,13 @@ class ZoneManager:
 
         Otherwise fall back to most-recent activation for removal.
         """
-        all_zones = self.coordinator.config.get(CONF_ZONES, [])
-
         # Next zone always uses config order (simplest, most predictable)
-        next_zone = next(
-            (z for z in all_zones if z not in active_zones and not self.is_locked(z)),
-            None,
-        )
+        active = set(active_zones)
+        next_zone = None
+        for z in self.coordinator._zones:
+            if z not in active and not self.is_locked(z):
+                next_zone = z
+                break
 
         # Determine if we should use temperature-based removal prioritization
         use_temp_priority = (
@@ -99,10 +103,11 @@ class ZoneManager:
         if use_temp_priority:
             last_zone = self._select_last_by_temperature(active_zones)
         else:
-            last_zone = next(
-                (z for z in reversed(active_zones) if not self.is_locked(z)),
-                None,
-            )
+            last_zone = None
+            for z in reversed(active_zones):
+                if not self.is_locked(z):
+                    last_zone = z
+                    break
 
         return next_zone, last_zone
 
@@ -138,10 +143,11 @@ class ZoneManager:
             return None
 
         # Get temperatures and comfort status
+        comfort_target = self.coordinator._comfort_target()
         zones_info = []
         for z in unlocked:
             temp = self.coordinator.zone_current_temps.get(z)
-            at_target = self.coordinator._all_active_zones_at_target(z)
+            at_target = self.coordinator._all_active_zones_at_target(z, comfort_target)
             zones_info.append((z, temp, at_target))
 
         # Separate zones by comfort status
@@ -188,7 +194,7 @@ class ZoneManager:
         last = self.coordinator.zone_last_changed.get(zone)
         if not last:
             return False
-        now = dt_util.utcnow().timestamp()
+        now = self.coordinator._tick_now
         last_type = self.coordinator.zone_last_changed_type.get(zone)
         if last_type == "on":
             threshold = self.coordinator.short_cycle_on_seconds
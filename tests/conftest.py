@@ -0,0 +1,72 @@
+import inspect
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import Context, Event, State
+
+from custom_components.solar_ac_controller import coordinator as coordinator_module
+
+BASE_CONFIG = {
+    "grid_sensor": "sensor.grid",
+    "solar_sensor": "sensor.solar",
+    "ac_power_sensor": "sensor.ac_power",
+    "ac_switch": "switch.ac",
+    "zones": ["climate.a", "climate.b"],
+}
+
+
+def _discard_job(job, *args, **kwargs):
+    """Stand in for hass.async_create_task without running the job."""
+    if inspect.iscoroutine(job):
+        job.close()
+    return MagicMock()
+
+
+@pytest.fixture
+def make_coordinator():
+    """Build a real SolarACCoordinator around a mocked hass and config entry.
+
+    states seeds the state machine by entity id; hass.async_create_task only
+    records its calls.
+    """
+
+    def _make(states=None, options=None, stored=None):
+        states = {
+            entity_id: State(entity_id, value)
+            for entity_id, value in (states or {}).items()
+        }
+        hass = MagicMock()
+        hass.states.get = states.get
+        hass.services.async_call = AsyncMock()
+        hass.async_create_task.side_effect = _discard_job
+        entry = MagicMock()
+        entry.data = dict(BASE_CONFIG)
+        entry.options = dict(options or {})
+        store = MagicMock()
+        store.async_save = AsyncMock()
+        with patch.object(
+            coordinator_module,
+            "async_track_state_change_event",
+            return_value=lambda: None,
+        ):
+            return coordinator_module.SolarACCoordinator(hass, entry, store, stored)
+
+    return _make
+
+
+@pytest.fixture
+def state_event():
+    """Build state_changed events as delivered to the tracked-state listener."""
+
+    def _event(entity_id, old, new, context=None):
+        return Event(
+            "state_changed",
+            {
+                "entity_id": entity_id,
+                "old_state": None if old is None else State(entity_id, old),
+                "new_state": None if new is None else State(entity_id, new),
+            },
+            context=context or Context(),
+        )
+
+    return _event
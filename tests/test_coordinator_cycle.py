@@ -0,0 +1,75 @@
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.solar_ac_controller.coordinator import (
+    _OUTAGE_UPDATE_INTERVAL,
+    _UPDATE_INTERVAL,
+)
+
+# Exporting nothing, importing nothing: no zone to add or remove
+BALANCED_STATES = {
+    "sensor.grid": "0",
+    "sensor.solar": "2000",
+    "sensor.ac_power": "0",
+    "switch.ac": "on",
+    "climate.a": "off",
+    "climate.b": "off",
+}
+
+
+@pytest.mark.asyncio
+async def test_balanced_cycle_is_reused_until_invalidated(make_coordinator):
+    coord = make_coordinator(states=BALANCED_STATES)
+    with patch.object(
+        coord, "_validate_sensor_state", wraps=coord._validate_sensor_state
+    ) as read:
+        await coord._async_run_cycle()
+        assert coord.last_action == "balanced"
+        assert coord._balanced
+        assert read.call_count == 3
+
+        # Nothing changed: the balanced decision is reused without any reads
+        await coord._async_run_cycle()
+        assert read.call_count == 3
+
+        # An invalidated decision is evaluated in full again
+        coord.invalidate_balanced_decision()
+        await coord._async_run_cycle()
+        assert read.call_count == 6
+        assert coord._balanced
+
+
+def test_snapshot_leaves_panic_manager_unbuilt(make_coordinator):
+    coord = make_coordinator(states=BALANCED_STATES)
+    assert not coord._snapshot().panic_cooldown
+    assert "panic_manager" not in coord.__dict__
+
+
+@pytest.mark.asyncio
+async def test_freeze_cycle_is_recorded_and_ends_solar_outage(make_coordinator):
+    coord = make_coordinator(states={**BALANCED_STATES, "sensor.solar": "100"})
+    coord._outage_entity = "sensor.solar"
+    coord.update_interval = _OUTAGE_UPDATE_INTERVAL
+    await coord._async_run_cycle()
+    assert coord.last_action == "solar_too_low"
+    assert coord.metrics.cycle_count == 1
+    assert coord.metrics.error_count == 0
+    assert coord._outage_entity is None
+    assert coord.update_interval == _UPDATE_INTERVAL
+
+
+@pytest.mark.asyncio
+async def test_listeners_notified_only_when_snapshot_changes(make_coordinator):
+    coord = make_coordinator(states=BALANCED_STATES)
+    updates = []
+    coord.async_add_listener(lambda: updates.append(coord.data))
+
+    await coord.async_refresh()
+    await coord.async_refresh()
+    assert len(updates) == 1
+
+    await coord.async_set_season_mode("cool")
+    updates.clear()
+    await coord.async_refresh()
+    assert [snapshot.season_mode for snapshot in updates] == ["cool"]
@@ -0,0 +1,29 @@
+import pytest
+
+
+@pytest.fixture
+def engine(make_coordinator):
+    coord = make_coordinator(options={"panic_threshold": 2500.0})
+
+    def _engine(samples=0):
+        coord.samples = samples
+        return coord.decision_engine
+
+    return _engine
+
+
+def test_add_conf_clamps_base_and_sample_bonus(engine):
+    assert engine().compute_add_conf(0.0, 500.0, False) == 5.0
+    assert engine(samples=50).compute_add_conf(5000.0, 500.0, False) == 65.0
+    assert engine(samples=3).compute_add_conf(750.0, 500.0, False) == 21.0
+
+
+def test_add_conf_short_cycle_penalty(engine):
+    assert engine().compute_add_conf(0.0, 500.0, True) == -25.0
+
+
+def test_remove_conf_clamps_and_bonuses(engine):
+    assert engine().compute_remove_conf(100.0, False) == 5.0
+    assert engine().compute_remove_conf(2000.0, False) == 85.0
+    assert engine().compute_remove_conf(1000.0, True) == 25.0
+    assert engine().compute_remove_conf(3000.0, False) == 100.0
@@ -0,0 +1,17 @@
+import pytest
+
+from custom_components.solar_ac_controller.coordinator import _ema_step
+
+
+def test_single_step_matches_fixed_coefficients():
+    ema_30s, ema_5m = _ema_step(1000.0, 0.0, 0.0)
+    assert ema_30s == pytest.approx(250.0)
+    assert ema_5m == pytest.approx(30.0)
+
+
+def test_gap_equals_repeated_steps():
+    one_shot = _ema_step(800.0, 100.0, 50.0, steps=3.0)
+    stepped = (100.0, 50.0)
+    for _ in range(3):
+        stepped = _ema_step(800.0, *stepped)
+    assert one_shot == pytest.approx(stepped)
@@ -0,0 +1,64 @@
+import pytest
+
+from custom_components.solar_ac_controller.helpers import _normalize_learned_entry
+
+
+def test_normalize_scalar_entry():
+    assert _normalize_learned_entry(1200, 1000.0) == {
+        "default": 1200.0,
+        "heat": 1200.0,
+        "cool": 1200.0,
+    }
+
+
+def test_normalize_partial_dict_fills_missing_modes_with_initial():
+    out = _normalize_learned_entry({"HEAT": "900", "bad": "x"}, 1000.0)
+    assert out == {"heat": 900.0, "default": 1000.0, "cool": 1000.0}
+
+
+def test_normalize_unknown_type_uses_initial():
+    assert _normalize_learned_entry(None, 1000.0)["cool"] == 1000.0
+
+
+def test_rounded_power_rounds_nested_values(make_coordinator):
+    data = {"a": {"default": 1234.6, "heat": "x"}, "b": 99.4}
+    assert make_coordinator()._rounded_power(data) == {
+        "a": {"default": 1235, "heat": "x"},
+        "b": 99,
+    }
+
+
+def test_get_learned_power_prefers_mode_then_default(make_coordinator):
+    coord = make_coordinator(
+        stored={"learned_power": {"a": {"default": 800, "heat": 900, "cool": 700}}}
+    )
+    assert coord.get_learned_power("a", "heat") == 900.0
+    assert coord.get_learned_power("a", "unknown") == 800.0
+    assert coord.get_learned_power("a") == 800.0
+    assert coord.get_learned_power("missing", "cool") == 1000.0
+
+
+def test_set_learned_power_creates_complete_entry(make_coordinator):
+    coord = make_coordinator()
+    coord.set_learned_power("a", 1100.0, mode="heat")
+    entry = coord.learned_power["a"]
+    assert set(entry) == {"default", "heat", "cool"}
+    assert entry["cool"] == 1000.0
+    assert entry["heat"] == entry["default"] > 1000.0
+
+
+@pytest.mark.asyncio
+async def test_persist_skips_identical_payload(make_coordinator):
+    coord = make_coordinator()
+    coord.set_learned_power("a", 1100.0)
+    await coord.async_persist_learned_values()
+    coord.mark_learned_values_dirty()
+    await coord.async_persist_learned_values()
+    coord.store.async_save.assert_awaited_once()
+    assert coord.stored_data["learned_power"]["a"]["default"] == 1030
+
+
+def test_normalize_canonical_entry_converts_to_floats():
+    out = _normalize_learned_entry({"default": 800, "heat": 900, "cool": 700.5}, 1.0)
+    assert out == {"default": 800.0, "heat": 900.0, "cool": 700.5}
+    assert all(type(v) is float for v in out.values())
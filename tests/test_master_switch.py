@@ -0,0 +1,63 @@
+import time
+
+import pytest
+from homeassistant.core import Context
+
+
+def test_lock_released_when_solar_side_matches(make_coordinator):
+    coord = make_coordinator(states={"switch.ac": "on"})
+    coord.master_manual_lock_state = "on"
+    coord._handle_master_switch(1500.0)
+    assert coord.master_manual_lock_state is None
+
+
+def test_lock_held_until_solar_reaches_other_side(make_coordinator):
+    coord = make_coordinator(states={"switch.ac": "off"})
+    coord.master_manual_lock_state = "off"
+    for solar in (1500.0, 1000.0, 1500.0):
+        coord._handle_master_switch(solar)
+        assert coord.master_manual_lock_state == "off"
+    coord._handle_master_switch(500.0)
+    assert coord.master_manual_lock_state is None
+
+
+@pytest.mark.asyncio
+async def test_manual_change_takes_lock_and_is_stored(make_coordinator, state_event):
+    coord = make_coordinator(states={"switch.ac": "on"})
+    coord._async_handle_tracked_state(state_event("switch.ac", "on", "off"))
+    assert coord.master_manual_lock_state == "off"
+
+    # Saved through the learned-value persist path, not a separate writer
+    await coord.async_flush_learned_values()
+    coord.store.async_delay_save.assert_not_called()
+    coord.store.async_save.assert_awaited_once()
+    assert coord.stored_data["master_manual_lock_state"] == "off"
+    assert coord.stored_data["master_last_state"] == "off"
+
+
+def test_own_call_does_not_take_lock(make_coordinator, state_event):
+    coord = make_coordinator(states={"switch.ac": "off"})
+    coord._handle_master_switch(1500.0)
+    assert coord._desired_master == "on"
+    context = Context(id=coord._own_contexts[-1])
+    coord._async_handle_tracked_state(state_event("switch.ac", "off", "on", context))
+    assert coord.master_manual_lock_state is None
+    assert coord._desired_master is None
+
+
+def test_lock_restored_from_stored_data(make_coordinator):
+    coord = make_coordinator(stored={"master_manual_lock_state": "off"})
+    assert coord.master_manual_lock_state == "off"
+
+
+def test_unconfirmed_request_falls_back_after_timeout(make_coordinator):
+    coord = make_coordinator(states={"switch.ac": "off"})
+    coord._handle_master_switch(1500.0)
+    assert coord._master_on
+    coord.hass.async_create_task.reset_mock()
+
+    # Switch never reported "on": the request is dropped and re-sent
+    coord._tick_now = time.monotonic() + 60.0
+    coord._handle_master_switch(1500.0)
+    assert coord._desired_master == "on"
+    coord.hass.async_create_task.assert_called_once()
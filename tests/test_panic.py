@@ -0,0 +1,85 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+
+def test_should_panic_needs_import_and_several_zones(make_coordinator):
+    coord = make_coordinator(options={"panic_threshold": 2500.0})
+    coord.ema_30s = 3000.0
+    assert coord.panic_manager.should_panic(2)
+    assert not coord.panic_manager.should_panic(1)
+    coord.ema_30s = 2000.0
+    assert not coord.panic_manager.should_panic(3)
+
+
+def test_cancel_clears_pending_delay(make_coordinator):
+    cancelled = []
+    manager = make_coordinator().panic_manager
+    manager._cancel_delay = lambda: cancelled.append(True)
+    assert manager.is_panicking
+    manager.cancel()
+    assert cancelled == [True]
+    assert not manager.is_panicking
+
+
+@pytest.mark.asyncio
+async def test_failing_zone_does_not_stop_panic_cooldown(make_coordinator):
+    zones = ["climate.a", "climate.b", "climate.c"]
+    coord = make_coordinator(
+        states={"switch.ac": "on"},
+        options={"zones": zones, "panic_threshold": 2500.0, "action_delay_seconds": 0},
+    )
+    coord.ema_30s = 3000.0
+
+    async def async_call(domain, service, data, **kwargs):
+        if data["entity_id"] == "climate.b":
+            raise RuntimeError("integration bug")
+
+    coord.hass.services.async_call = AsyncMock(side_effect=async_call)
+    await coord.panic_manager._panic_task_runner(zones)
+
+    shed = [c.args[2]["entity_id"] for c in coord.hass.services.async_call.mock_calls]
+    assert "climate.c" in shed
+    assert coord.last_panic_ts is not None
+    assert coord.last_action == "panic"
+
+
+def _delayed_panic(make_coordinator):
+    coord = make_coordinator(
+        states={"switch.ac": "on"},
+        options={"panic_threshold": 2500.0},
+    )
+    coord.panic_delay = 0.01
+    coord.ema_30s = 3000.0
+    coord.hass.loop = asyncio.get_running_loop()
+    coord.hass.async_run_hass_job.side_effect = lambda job, *args: job.target(*args)
+    return coord
+
+
+def _panic_tasks(coord):
+    return [
+        c
+        for c in coord.hass.async_create_task.call_args_list
+        if c.kwargs.get("name") == "solar_ac_panic"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_delayed_panic_sheds_once_delay_passes(make_coordinator):
+    coord = _delayed_panic(make_coordinator)
+    await coord.panic_manager.schedule_panic(["climate.a", "climate.b"])
+    assert coord.panic_manager.is_panicking
+    assert not _panic_tasks(coord)
+    await asyncio.sleep(0.05)
+    assert len(_panic_tasks(coord)) == 1
+
+
+@pytest.mark.asyncio
+async def test_cancel_during_delay_prevents_shed(make_coordinator):
+    coord = _delayed_panic(make_coordinator)
+    await coord.panic_manager.schedule_panic(["climate.a", "climate.b"])
+    coord.panic_manager.cancel()
+    await asyncio.sleep(0.05)
+    assert not _panic_tasks(coord)
+    assert not coord.panic_manager.is_panicking
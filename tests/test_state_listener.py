@@ -0,0 +1,74 @@
+from datetime import timedelta
+
+from custom_components.solar_ac_controller.coordinator import (
+    _OUTAGE_UPDATE_INTERVAL,
+    _UPDATE_INTERVAL,
+)
+
+
+def _task_names(coord):
+    return [c.kwargs.get("name") for c in coord.hass.async_create_task.call_args_list]
+
+
+def test_grid_change_ends_stretched_interval(make_coordinator, state_event):
+    coord = make_coordinator()
+    coord.update_interval = timedelta(seconds=30)
+    coord._async_handle_tracked_state(state_event("sensor.grid", "100", "2500"))
+    assert coord.update_interval == _UPDATE_INTERVAL
+    assert _task_names(coord) == ["solar_ac_input_changed"]
+
+
+def test_grid_change_at_base_interval_only_invalidates(make_coordinator, state_event):
+    coord = make_coordinator()
+    coord._balanced = True
+    coord._async_handle_tracked_state(state_event("sensor.grid", "100", "110"))
+    assert not coord._balanced
+    assert _task_names(coord) == []
+
+
+def test_outage_ends_only_when_failed_sensor_recovers(make_coordinator, state_event):
+    coord = make_coordinator()
+    coord._outage_entity = "sensor.ac_power"
+    coord.update_interval = _OUTAGE_UPDATE_INTERVAL
+
+    coord._async_handle_tracked_state(state_event("sensor.grid", "100", "200"))
+    coord._async_handle_tracked_state(
+        state_event("sensor.ac_power", "unavailable", "unknown")
+    )
+    assert coord.update_interval == _OUTAGE_UPDATE_INTERVAL
+    assert _task_names(coord) == []
+
+    coord._async_handle_tracked_state(
+        state_event("sensor.ac_power", "unavailable", "450")
+    )
+    assert coord._outage_entity is None
+    assert coord.update_interval == _UPDATE_INTERVAL
+    assert _task_names(coord) == ["solar_ac_sensor_recovered"]
+
+
+def test_small_grid_fluctuation_keeps_stretched_interval(make_coordinator, state_event):
+    coord = make_coordinator()
+    coord._balanced = True
+    coord._grid_band = coord._grid_wake_band(-400.0, 1000.0)
+    coord.update_interval = timedelta(seconds=30)
+
+    coord._async_handle_tracked_state(state_event("sensor.grid", "-400", "-380"))
+    coord._async_handle_tracked_state(state_event("sensor.ac_power", "900", "950"))
+    assert coord._balanced
+    assert coord.update_interval == timedelta(seconds=30)
+    assert _task_names(coord) == []
+
+    # Import starts: the decision may change, so evaluate now
+    coord._async_handle_tracked_state(state_event("sensor.grid", "-380", "150"))
+    assert not coord._balanced
+    assert coord.update_interval == _UPDATE_INTERVAL
+    assert _task_names(coord) == ["solar_ac_input_changed"]
+
+
+def test_solar_counts_only_when_crossing_a_threshold(make_coordinator, state_event):
+    coord = make_coordinator()
+    coord._balanced = True
+    coord._async_handle_tracked_state(state_event("sensor.solar", "2000", "1500"))
+    assert coord._balanced
+    coord._async_handle_tracked_state(state_event("sensor.solar", "1500", "700"))
+    assert not coord._balanced
@@ -0,0 +1,33 @@
+from types import SimpleNamespace
+
+from custom_components.solar_ac_controller.zone_config_parser import ZoneConfigParser
+
+ZONES = ["climate.a", "climate.b", "climate.c"]
+
+
+def _entry(data=None, options=None):
+    return SimpleNamespace(data=data or {}, options=options or {})
+
+
+def test_temp_sensors_skip_empty_slots_and_prefer_options():
+    entry = _entry(
+        data={"zone_temp_sensors": ["sensor.old"]},
+        options={"zone_temp_sensors": ["sensor.a", "", "sensor.c"]},
+    )
+    assert ZoneConfigParser.parse_temp_sensors(entry, ZONES) == {
+        "climate.a": "sensor.a",
+        "climate.c": "sensor.c",
+    }
+
+
+def test_manual_power_numeric_string_maps_by_index():
+    entry = _entry(data={"zone_manual_power": "1200, 900.5"})
+    assert ZoneConfigParser.parse_manual_power(entry, ZONES) == {
+        "climate.a": 1200.0,
+        "climate.b": 900.5,
+    }
+
+
+def test_manual_power_legacy_pairs():
+    entry = _entry(options={"zone_manual_power": ["climate.c:700", "bad:x"]})
+    assert ZoneConfigParser.parse_manual_power(entry, ZONES) == {"climate.c": 700.0}
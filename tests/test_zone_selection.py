@@ -0,0 +1,40 @@
+ZONES = ["climate.a", "climate.b", "climate.c"]
+
+
+def _manager(make_coordinator, locked=(), states=None):
+    coord = make_coordinator(
+        states=states, options={"zones": ZONES, "season_mode": "cool"}
+    )
+    coord.enable_temp_modulation = False
+    coord._tick_now = 50.0
+    coord.zone_manual_lock_until = {z: 100.0 for z in locked}
+    return coord.zone_manager
+
+
+def test_next_in_config_order_last_most_recent(make_coordinator):
+    mgr = _manager(make_coordinator)
+    assert mgr.select_next_and_last_zone(["climate.c", "climate.a"]) == (
+        "climate.b",
+        "climate.a",
+    )
+
+
+def test_locked_zones_are_skipped(make_coordinator):
+    mgr = _manager(make_coordinator, locked=("climate.b", "climate.a"))
+    assert mgr.select_next_and_last_zone(["climate.c", "climate.a"]) == (
+        None,
+        "climate.c",
+    )
+
+
+def test_manual_change_locks_zone_unless_ours(make_coordinator):
+    mgr = _manager(
+        make_coordinator,
+        states={"climate.a": "cool", "climate.b": "cool", "climate.c": "off"},
+    )
+    coord = mgr.coordinator
+    coord.manual_lock_seconds = 600
+    coord.zone_last_state = {"climate.a": "off", "climate.b": "off"}
+    coord.last_action = "add_climate.b"
+    assert mgr.update_zone_states_and_overrides() == ["climate.a", "climate.b"]
+    assert coord.zone_manual_lock_until == {"climate.a": 650.0}